@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import os
+import queue
+import threading
 import time
 import logging
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -14,6 +18,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from .sources.tools import wait_for_network_idle, wait_for_page_growth
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +32,28 @@ class BrowserConfig:
     implicit_wait: float = 10.0
     use_proxy: bool = False
     proxy_fallback: bool = True  # Usar fallback automático se proxy falhar
+    block_media: bool = True  # Não baixar imagens, fontes e vídeos (listagens carregam mais rápido)
+    block_trackers: bool = True  # Bloquear scripts de analytics/anúncios de terceiros
+
+
+# Seletor para get_page(wait_selector=...) em páginas de artigo: retorna assim que
+# o conteúdo principal existe no DOM, sem espera fixa
+ARTICLE_READY_SELECTOR = "article, h1"
+
+# Padrões de URL bloqueados via CDP quando block_media=True
+BLOCKED_MEDIA_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8",
+]
+
+# Domínios de analytics/anúncios bloqueados via CDP quando block_trackers=True
+BLOCKED_TRACKER_PATTERNS = [
+    "*doubleclick.net*", "*googlesyndication.com*", "*google-analytics.com*",
+    "*googletagmanager.com*", "*googletagservices.com*", "*adsystem*",
+    "*facebook.net*", "*taboola.com*", "*outbrain.com*", "*scorecardresearch.com*",
+    "*chartbeat.com*", "*hotjar.com*", "*criteo.com*",
+]
 
 
 class ProfessionalScraper:
@@ -127,6 +155,14 @@ class ProfessionalScraper:
                 "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             )
 
+        # Não carregar imagens/plugins (o DOM e os links continuam intactos)
+        if self.config.block_media:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.plugins": 2,
+            })
+
         # Anti-detecção
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
@@ -138,6 +174,28 @@ class ProfessionalScraper:
         # Remove webdriver property
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+        self._block_urls()
+
+    def _blocked_url_patterns(self) -> list[str]:
+        """Padrões de URL que o Chrome não deve baixar."""
+        patterns: list[str] = []
+        if self.config.block_media:
+            patterns.extend(BLOCKED_MEDIA_PATTERNS)
+        if self.config.block_trackers:
+            patterns.extend(BLOCKED_TRACKER_PATTERNS)
+        return patterns
+
+    def _block_urls(self) -> None:
+        """Bloqueia requisições desnecessárias (mídia, analytics, anúncios) via CDP."""
+        patterns = self._blocked_url_patterns()
+        if not patterns:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logger.debug(f"Bloqueio de URLs via CDP indisponível: {e}")
+
     def stop(self) -> None:
         """Fecha o browser."""
         if self.driver:
@@ -289,10 +347,23 @@ class ProfessionalScraper:
 
         return sorted(urls)
 
-    def scroll_and_load(self, scroll_pause: float = 2.0, max_scrolls: int = 5) -> str:
+    def scroll_and_load(
+        self,
+        scroll_pause: float = 2.0,
+        max_scrolls: int = 5,
+        wait_strategy: Literal["sleep", "network_idle"] = "sleep",
+    ) -> str:
         """Scroll progressivo para carregar conteúdo lazy-load.
 
         Útil para feeds infinitos.
+
+        Args:
+            scroll_pause: Pausa após cada scroll (em "network_idle", tempo
+                máximo de espera por conteúdo novo)
+            max_scrolls: Número máximo de scrolls
+            wait_strategy: "sleep" (padrão) espera scroll_pause fixo;
+                "network_idle" espera a página crescer, depois a rede ficar
+                ociosa, e para assim que um scroll não carrega nada novo
         """
         if not self.driver:
             raise RuntimeError("Browser não iniciado.")
@@ -301,7 +372,14 @@ class ProfessionalScraper:
 
         for _ in range(max_scrolls):
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause)
+
+            if wait_strategy == "network_idle":
+                # A rede só é um sinal útil depois que o lote novo começou a chegar
+                if wait_for_page_growth(self.driver, last_height, timeout=scroll_pause) is None:
+                    break
+                wait_for_network_idle(self.driver, timeout=scroll_pause)
+            else:
+                time.sleep(scroll_pause)
 
             new_height = self.driver.execute_script("return document.body.scrollHeight")
             if new_height == last_height:
@@ -311,6 +389,153 @@ class ProfessionalScraper:
         return self.driver.page_source
 
 
+class BrowserPool:
+    """Pool de browsers Selenium reutilizáveis.
+
+    Permite que vários scrapers (ou categorias) rodem em paralelo, cada um
+    com seu próprio Chrome, sem pagar o custo de inicialização a cada coleta.
+    O tamanho é configurável via ``SCRAPER_POOL_MIN_SIZE`` e
+    ``SCRAPER_POOL_MAX_SIZE``.
+
+    Example:
+        >>> with BrowserPool(BrowserConfig(headless=True)) as pool:
+        ...     scraper = ReutersScraper(pool)
+        ...     urls = scraper.get_latest_articles(limit=10)
+    """
+
+    def __init__(
+        self,
+        config: BrowserConfig | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
+    ):
+        self.config = config or BrowserConfig()
+        if min_size is None:
+            min_size = int(os.environ.get("SCRAPER_POOL_MIN_SIZE", "1"))
+        if max_size is None:
+            max_size = int(os.environ.get("SCRAPER_POOL_MAX_SIZE", "3"))
+        self.max_size = max(1, max_size)
+        self.min_size = max(0, min(min_size, self.max_size))
+        self._idle: queue.LifoQueue[ProfessionalScraper] = queue.LifoQueue()
+        self._browsers: list[ProfessionalScraper] = []
+        # Vagas ocupadas (browsers prontos + em inicialização), contadas sob _lock
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _reserve(self) -> bool:
+        """Reserva uma vaga para um browser novo, se o pool ainda não estiver cheio."""
+        with self._lock:
+            if self._size >= self.max_size:
+                return False
+            self._size += 1
+            return True
+
+    def _spawn(self) -> ProfessionalScraper:
+        """
+        Cria e inicia um novo browser numa vaga já reservada.
+
+        Roda fora de ``_lock``: iniciar o Chrome leva segundos e não deve
+        bloquear acquire/release dos outros threads. Se a inicialização
+        falhar, a vaga é liberada.
+        """
+        browser = ProfessionalScraper(replace(self.config))
+        try:
+            browser.start()
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+            raise
+        with self._lock:
+            self._browsers.append(browser)
+        return browser
+
+    @staticmethod
+    def _is_alive(browser: ProfessionalScraper) -> bool:
+        """Verifica se o Chrome do browser ainda responde."""
+        if not browser.driver:
+            return False
+        try:
+            # Só para levantar exceção se a sessão do WebDriver morreu
+            _ = browser.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def start(self) -> None:
+        """Pré-aquece o pool com ``min_size`` browsers."""
+        with self._lock:
+            missing = max(0, self.min_size - self._size)
+            self._size += missing
+        for started in range(missing):
+            try:
+                self._idle.put(self._spawn())
+            except BaseException:
+                # _spawn já liberou a própria vaga; libera as que não chegaram a ser usadas
+                with self._lock:
+                    self._size -= missing - started - 1
+                raise
+
+    def stop(self) -> None:
+        """Fecha todos os browsers do pool."""
+        with self._lock:
+            browsers, self._browsers = self._browsers, []
+            self._size = 0
+            self._idle = queue.LifoQueue()
+        for browser in browsers:
+            try:
+                browser.stop()
+            except Exception as e:
+                logger.debug(f"Erro ao fechar browser do pool: {e}")
+
+    def acquire(self, timeout: float | None = None) -> ProfessionalScraper:
+        """
+        Obtém um browser livre, criando um novo se o pool ainda não estiver cheio.
+
+        Args:
+            timeout: Tempo máximo de espera por um browser livre (None = sem limite)
+
+        Returns:
+            Browser pronto para uso (deve ser devolvido com ``release``)
+        """
+        try:
+            browser = self._idle.get_nowait()
+        except queue.Empty:
+            if self._reserve():
+                return self._spawn()
+            browser = self._idle.get(timeout=timeout)
+
+        # Health check: reinicia Chromes que morreram
+        if not self._is_alive(browser):
+            logger.warning("Browser do pool não responde, reiniciando...")
+            try:
+                browser.stop()
+            except Exception:
+                pass
+            browser.start()
+
+        return browser
+
+    def release(self, browser: ProfessionalScraper) -> None:
+        """Devolve um browser ao pool."""
+        self._idle.put(browser)
+
+    @contextmanager
+    def browser(self):
+        """Context manager que faz acquire/release automaticamente."""
+        browser = self.acquire()
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+
 def scrape_with_browser(
     url: str,
     headless: bool = True,
@@ -454,11 +454,18 @@ def main(argv: list[str] | None = None) -> int:
     
     if args.cmd == "collect":
         from datetime import datetime
-        from .infomoney_scraper import InfoMoneyScraper
-        from .moneytimes_scraper import MoneyTimesScraper
-        from .valor_scraper import ValorScraper
-        from .bloomberg_scraper import BloombergScraper
-        from .einvestidor_scraper import EInvestidorScraper
+        from .browser import BrowserPool
+        from .sources import scrape_many
+        from .sources.en import BloombergScraper
+        from .sources.pt import EInvestidorScraper, InfoMoneyScraper, MoneyTimesScraper, ValorScraper
+        
+        source_scrapers = {
+            "infomoney": InfoMoneyScraper,
+            "moneytimes": MoneyTimesScraper,
+            "valor": ValorScraper,
+            "bloomberg": BloombergScraper,
+            "einvestidor": EInvestidorScraper,
+        }
         
         # Configurar logging se verbose
         if args.verbose:
@@ -468,11 +475,14 @@ def main(argv: list[str] | None = None) -> int:
         # Determinar fontes
         sources = args.source
         if "all" in sources:
-            sources = ["infomoney", "moneytimes", "valor", "bloomberg", "einvestidor"]
+            sources = list(source_scrapers)
         else:
-            sources = list(set(sources))  # Remove duplicatas
+            sources = list(dict.fromkeys(sources))  # Remove duplicatas, mantendo a ordem
         
         print(f"🎯 Coletando de {len(sources)} fonte(s): {', '.join(sources)}")
+        print(f"   Limite: {args.limit} artigos por fonte")
+        if args.category:
+            print(f"   Categoria: {args.category}")
         
         # Configurar browser
         config = BrowserConfig(
@@ -481,65 +491,37 @@ def main(argv: list[str] | None = None) -> int:
             proxy_fallback=args.proxy_fallback,
         )
         
-        all_urls = []
+        # Money Times não tem categorias; as demais fontes recebem --category
+        categories = {
+            source_name: None if source_name == "moneytimes" else args.category
+            for source_name in sources
+        }
         
-        with ProfessionalScraper(config) as browser:
-            for source_name in sources:
-                print(f"\n📰 Fonte: {source_name.upper()}")
-                print(f"   Limite: {args.limit} artigos")
-                if args.category:
-                    print(f"   Categoria: {args.category}")
-                
-                try:
-                    urls = []
-                    
-                    if source_name == "infomoney":
-                        scraper = InfoMoneyScraper(scraper=browser)
-                        urls = scraper.get_latest_articles(
-                            category=args.category,
-                            limit=args.limit
-                        )
-                    
-                    elif source_name == "moneytimes":
-                        scraper = MoneyTimesScraper(scraper=browser)
-                        urls = scraper.get_latest_articles(limit=args.limit)
-                    
-                    elif source_name == "valor":
-                        scraper = ValorScraper(scraper=browser)
-                        urls = scraper.get_latest_articles(
-                            category=args.category,
-                            limit=args.limit
-                        )
-                    
-                    elif source_name == "bloomberg":
-                        scraper = BloombergScraper(scraper=browser)
-                        urls = scraper.get_latest_articles(
-                            category=args.category,
-                            limit=args.limit
-                        )
-                    
-                    elif source_name == "einvestidor":
-                        scraper = EInvestidorScraper(scraper=browser)
-                        urls = scraper.get_latest_articles(
-                            category=args.category,
-                            limit=args.limit
-                        )
-                    
-                    print(f"   ✓ Coletadas {len(urls)} URLs")
-                    all_urls.extend(urls)
-                    
-                except Exception as e:
-                    print(f"   ✗ Erro: {e}")
-                    if args.verbose:
-                        import traceback
-                        traceback.print_exc()
+        # Fontes coletadas em paralelo, cada uma com seu browser do pool:
+        # o tempo total é o da fonte mais lenta, não a soma
+        jobs = {name: (source_scrapers[name], categories[name]) for name in sources}
+        with BrowserPool(config, min_size=0, max_size=len(sources)) as pool:
+            results = scrape_many(pool, list(jobs.values()), limit=args.limit)
+        
+        all_urls = []
+        for source_name, job in jobs.items():
+            result = results[job]
+            print(f"\n📰 Fonte: {source_name.upper()}")
+            if result.error is not None:
+                print(f"   ✗ Erro: {result.error}")
+                if args.verbose:
+                    import traceback
+                    traceback.print_exception(result.error)
+                continue
+            print(f"   ✓ Coletadas {len(result.urls)} URLs")
+            all_urls.extend(result.urls)
         
         print(f"\n📊 Total de URLs coletadas: {len(all_urls)}")
         
         # Salvar URLs se solicitado
         if args.urls_out:
             args.urls_out.parent.mkdir(parents=True, exist_ok=True)
-            args.urls_out.write_text("\n".join(all_urls) + "\n", encoding="utf-8")
+            args.urls_out.write_text("".join(f"{url}\n" for url in all_urls), encoding="utf-8")
             print(f"   💾 URLs salvas em: {args.urls_out}")
         
         # Scrape se não for skip
@@ -41,8 +41,9 @@ def _parse_date(value: str | None) -> datetime | None:
         return None
 
 
-def _fallback_extract(html: str, url: str) -> Article:
-    soup = BeautifulSoup(html, "lxml")
+def _fallback_extract(html: str, url: str, soup: BeautifulSoup | None = None) -> Article:
+    if soup is None:
+        soup = BeautifulSoup(html, "lxml")
     title = _title_from_html(soup)
 
     paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
@@ -141,7 +142,7 @@ def _source_from_html(soup: BeautifulSoup) -> str | None:
     return None
 
 
-def extract_article(html: str, url: str) -> Article:
+def extract_article(html: str, url: str, soup: BeautifulSoup | None = None) -> Article:
     """
     Extrai metadados e texto de uma página HTML.
     
@@ -151,6 +152,13 @@ def extract_article(html: str, url: str) -> Article:
     3. BeautifulSoup (fallback básico)
     
     Inclui validação, limpeza e detecção de paywall.
+    
+    Args:
+        html: HTML da página
+        url: URL do artigo
+        soup: Árvore já parseada do mesmo HTML (BeautifulSoup com "lxml");
+            reaproveitada pelo trafilatura (campos faltantes) e pelo fallback
+            em vez de um novo parse. Não é modificada.
     """
     
     # Tentar método avançado com múltiplos extratores
@@ -166,7 +174,7 @@ def extract_article(html: str, url: str) -> Article:
     # Fallback para trafilatura
     if trafilatura is not None:
         try:
-            article = _extract_with_trafilatura(html, url)
+            article = _extract_with_trafilatura(html, url, soup=soup)
             if article:
                 logger.debug(f"Extracted with trafilatura: {article.title}")
                 return article
@@ -175,7 +183,7 @@ def extract_article(html: str, url: str) -> Article:
     
     # Fallback final para BeautifulSoup
     logger.debug("Using BeautifulSoup fallback")
-    return _fallback_extract(html, url)
+    return _fallback_extract(html, url, soup=soup)
 
 
 def _extract_with_pipeline(html: str, url: str) -> Article | None:
@@ -243,7 +251,7 @@ def _extract_with_pipeline(html: str, url: str) -> Article | None:
     return article
 
 
-def _extract_with_trafilatura(html: str, url: str) -> Article | None:
+def _extract_with_trafilatura(html: str, url: str, soup: BeautifulSoup | None = None) -> Article | None:
     """Extrai usando trafilatura (método legado)."""
 
     extracted_json: str | None = None
@@ -278,8 +286,9 @@ def _extract_with_trafilatura(html: str, url: str) -> Article | None:
     )
 
     # Completa campos faltantes com heurísticas do HTML.
-    soup: BeautifulSoup | None = None
-    if article.title is None or article.text is None or article.date_published is None or article.source is None:
+    if soup is None and (
+        article.title is None or article.text is None or article.date_published is None or article.source is None
+    ):
         soup = BeautifulSoup(html, "lxml")
 
     if article.title is None and soup is not None:
@@ -17,10 +17,16 @@ class PoliteSettings:
 
 
 class PoliteSession:
-    def __init__(self, settings: PoliteSettings | None = None):
+    def __init__(
+        self,
+        settings: PoliteSettings | None = None,
+        session: requests.Session | None = None,
+    ):
         self.settings = settings or PoliteSettings()
-        self._session = requests.Session()
-        self._session.headers.update({"User-Agent": self.settings.user_agent})
+        # Uma requests.Session externa pode ser compartilhada entre instâncias para
+        # reaproveitar conexões keep-alive; o User-Agent vai em cada requisição.
+        self._session = session or requests.Session()
+        self._headers = {"User-Agent": self.settings.user_agent}
         self._last_request_by_netloc: dict[str, float] = {}
         self._robots_by_netloc: dict[str, urllib.robotparser.RobotFileParser] = {}
 
@@ -34,7 +40,7 @@ class PoliteSession:
         last = self._last_request_by_netloc.get(netloc)
         if last is None:
             return
-        elapsed = time.time() - last
+        elapsed = time.monotonic() - last
         remaining = delay - elapsed
         if remaining > 0:
             time.sleep(remaining)
@@ -71,7 +77,9 @@ class PoliteSession:
         if self.settings.respect_robots and not self.allowed(url):
             raise PermissionError(f"Bloqueado por robots.txt: {url}")
 
-        resp = self._session.get(url, timeout=self.settings.timeout_seconds)
-        self._last_request_by_netloc[netloc] = time.time()
+        resp = self._session.get(
+            url, headers=self._headers, timeout=self.settings.timeout_seconds
+        )
+        self._last_request_by_netloc[netloc] = time.monotonic()
         resp.raise_for_status()
         return resp
@@ -33,6 +33,9 @@ from .en import (
     InvestingComScraper,
 )
 
+# Coleta paralela de várias fontes
+from .base_scraper import JobResult, scrape_many, scrape_many_async
+
 # Importar funções utilitárias CSV
 from .csv_utils import load_sources_csv, enabled_rss_feeds, Source
 
@@ -58,6 +61,10 @@ __all__ = [
     "YahooFinanceUSScraper",
     "BusinessInsiderScraper",
     "InvestingComScraper",
+    # Coleta paralela
+    "scrape_many",
+    "scrape_many_async",
+    "JobResult",
     # CSV Utils
     "load_sources_csv",
     "enabled_rss_feeds",
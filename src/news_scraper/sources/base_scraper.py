@@ -8,14 +8,32 @@ Classe base robusta para todos os scrapers com:
 """
 
 from __future__ import annotations
+import re
+import sys
 import time
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Type
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
-from .tools import RetryStrategy, RetryConfig, PaywallDetector, RateLimiter
+
+try:
+    import re2  # google-re2: casamento em tempo linear (DFA), sem backtracking
+except ImportError:  # dependência opcional: pip install news-scraper[fast]
+    re2 = None
+
+from .tools import (
+    RetryStrategy,
+    RetryConfig,
+    PaywallDetector,
+    RateLimiter,
+    wait_for_page_growth,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +68,74 @@ class ScraperMetrics:
         }
 
 
+@dataclass
+class JobResult:
+    """Resultado de um job de scrape_many: URLs coletadas ou o erro da coleta."""
+    urls: List[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
+def compile_url_filter(pattern: str, flags: int = 0):
+    """
+    Compila um filtro de URL (alternâncias de trechos), com RE2 se instalado.
+    
+    RE2 casa em tempo linear no tamanho da URL, independente do número de
+    alternativas. Sem RE2, ou se o padrão usar sintaxe que ele não aceita,
+    cai para o módulo ``re``; a interface (``search``, ``pattern``) é a mesma.
+    
+    Args:
+        pattern: Expressão regular
+        flags: Apenas re.IGNORECASE é suportado
+        
+    Returns:
+        Padrão compilado (RE2 ou re)
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _ignores_case(regex) -> bool:
+    """Indica se um padrão de compile_url_filter ignora maiúsculas/minúsculas."""
+    options = getattr(regex, "options", None)
+    if options is not None:  # RE2
+        return not options.case_sensitive
+    return bool(regex.flags & re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=50_000)
+def _accept_href(
+    accept_re: Optional[re.Pattern],
+    reject_re: Optional[re.Pattern],
+    href: str,
+) -> bool:
+    """
+    Aplica os filtros de URL de um scraper (memoizado).
+    
+    O mesmo href costuma aparecer várias vezes na listagem (teaser, card,
+    relacionados) e entre coletas; o cache é global ao processo.
+    """
+    if accept_re is not None and not accept_re.search(href):
+        return False
+    return reject_re is None or not reject_re.search(href)
+
+
+def _leased_browser(browser_scraper):
+    """
+    Context manager que fornece um browser para uma coleta.
+    
+    Com um BrowserPool, empresta um browser via ``pool.browser()`` e o
+    devolve ao final; com um browser único, apenas o repassa.
+    """
+    pool_browser = getattr(browser_scraper, "browser", None)
+    return pool_browser() if callable(pool_browser) else nullcontext(browser_scraper)
+
+
 class ScraperException(Exception):
     """Exceção base para erros de scraping."""
     pass
@@ -85,12 +171,38 @@ class BaseScraper(ABC):
     RATE_LIMIT_DELAY = 1.0
     HAS_PAYWALL = False
     
+    # Coleta de links via Selenium (ver _harvest_links)
+    COMBINED_LINK_SELECTOR = "a"
+    MAX_SCROLLS = 2
+    # Espera máxima (s) por conteúdo novo depois de cada scroll
+    SCROLL_WAIT_TIMEOUT = 3.0
+    _HREFS_JS = "return Array.from(document.querySelectorAll(arguments[0]), a => a.href);"
+    # Igual a _HREFS_JS, mas filtra no navegador (domínio, tamanho mínimo e _REJECT_RE)
+    _FILTERED_HREFS_JS = (
+        "const [selector, domain, minLength, reject, flags] = arguments;"
+        "const rejectRe = reject ? new RegExp(reject, flags) : null;"
+        "return Array.from(document.querySelectorAll(selector), a => a.href).filter("
+        "h => h.includes(domain) && h.length > minLength && !(rejectRe && rejectRe.test(h)));"
+    )
+    
+    # Filtros de URL de artigo (regex pré-compiladas por subclasse)
+    _ACCEPT_RE: Optional[re.Pattern] = None
+    _REJECT_RE: Optional[re.Pattern] = None
+    
+    # Internar URLs coletadas (prefixos longos repetidos); desligar em execuções
+    # muito grandes, pois strings internadas não são liberadas
+    INTERN_URLS = True
+    
     def __init__(self, browser_scraper, source_id: str):
         """
         Inicializa scraper base.
         
         Args:
-            browser_scraper: Instância do BrowserScraper
+            browser_scraper: Instância do BrowserScraper. Um BrowserPool só é
+                aceito pelos scrapers que obtêm o browser via _browser()
+                (Reuters, WSJ, MarketWatch, SeekingAlpha e Investopedia); os
+                demais usam self.scraper diretamente e, com um pool, devem
+                rodar via scrape_many, que empresta um browser por job
             source_id: ID único da fonte
         """
         self.scraper = browser_scraper
@@ -107,6 +219,94 @@ class BaseScraper(ABC):
         self.paywall_detector = PaywallDetector()
         self.rate_limiter = RateLimiter(requests_per_second=0.5)  # 30 requests/minute = 0.5/sec
     
+    def _browser(self):
+        """
+        Fornece um browser para a coleta.
+        
+        Se o scraper foi criado com um BrowserPool, um browser é obtido do
+        pool e devolvido ao final; caso contrário, usa o browser único.
+        """
+        return _leased_browser(self.scraper)
+    
+    def _accept(self, href: str) -> bool:
+        """
+        Decide se um link é URL de artigo.
+        
+        Aceita se casar com _ACCEPT_RE e não casar com _REJECT_RE (cada
+        regex é opcional). Subclasses podem sobrescrever para regras mais
+        complexas.
+        """
+        return _accept_href(self._ACCEPT_RE, self._REJECT_RE, href)
+    
+    def _dom_hrefs(self, driver, domain: str, min_length: int = 0, selector: str = "a") -> List[str]:
+        """
+        Coleta hrefs já filtrados dentro do navegador.
+        
+        O filtro roda no motor JS do Chrome e só os hrefs aprovados cruzam
+        o WebDriver: precisam conter ``domain``, ter mais de ``min_length``
+        caracteres e não casar com _REJECT_RE (repassada ao RegExp do JS,
+        por isso deve usar apenas sintaxe comum a Python e JavaScript).
+        
+        Args:
+            driver: WebDriver com a listagem carregada
+            domain: Trecho obrigatório da URL (ex: "infomoney.com.br")
+            min_length: Tamanho mínimo (exclusivo) da URL
+            selector: Seletor CSS dos links
+            
+        Returns:
+            Hrefs absolutos na ordem do documento
+        """
+        reject, flags = None, ""
+        if self._REJECT_RE is not None:
+            reject = self._REJECT_RE.pattern
+            flags = "i" if _ignores_case(self._REJECT_RE) else ""
+        return driver.execute_script(
+            self._FILTERED_HREFS_JS, selector, domain, min_length, reject, flags
+        ) or []
+    
+    def _intern(self, url: str) -> str:
+        """Retorna a cópia internada da URL (se INTERN_URLS estiver ativo)."""
+        return sys.intern(url) if self.INTERN_URLS else url
+    
+    def _harvest_links(self, driver, limit: int) -> List[str]:
+        """
+        Coleta links de artigos da página atual, rolando só se faltar URL.
+        
+        Lê todos os hrefs de COMBINED_LINK_SELECTOR em uma única chamada
+        JavaScript e rola a página (até MAX_SCROLLS vezes) apenas enquanto
+        não houver URLs suficientes. Depois de cada scroll espera a página
+        crescer (até SCROLL_WAIT_TIMEOUT); se nada novo chegar, para.
+        
+        Args:
+            driver: WebDriver com a listagem já carregada
+            limit: Número máximo de URLs
+            
+        Returns:
+            Lista de URLs aceitas por _accept
+        """
+        # dict preserva a ordem da página (mais destaque primeiro)
+        urls: dict[str, None] = {}
+        
+        for attempt in range(self.MAX_SCROLLS + 1):
+            hrefs = driver.execute_script(self._HREFS_JS, self.COMBINED_LINK_SELECTOR) or []
+            for href in hrefs:
+                if href and self._accept(href):
+                    urls[href] = None
+                    if len(urls) >= limit:
+                        break
+            
+            if len(urls) >= limit or attempt == self.MAX_SCROLLS:
+                break
+            
+            # readyState continua "complete" após o scroll; o sinal de
+            # conteúdo novo é o aumento de scrollHeight
+            height = driver.execute_script("return document.body.scrollHeight;")
+            driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
+            if wait_for_page_growth(driver, height, timeout=self.SCROLL_WAIT_TIMEOUT) is None:
+                break
+        
+        return list(urls)[:limit]
+    
     @abstractmethod
     def _collect_urls(
         self, 
@@ -356,3 +556,126 @@ class MetricsCollector:
         """Exporta métricas para JSON."""
         import json
         return json.dumps([m.to_dict() for m in self.metrics], indent=2)
+
+
+def get_scraper(scraper_cls: Type[BaseScraper], browser_scraper) -> BaseScraper:
+    """
+    Retorna a instância do scraper associada a um browser, criando-a só uma vez.
+    
+    As funções de conveniência (scrape_investing_com etc.) usam este cache para
+    não recriar o scraper a cada chamada: reutilizar o mesmo browser evita o
+    custo de iniciar um novo Chrome (3-5 s) e mantém o rate limiting entre
+    chamadas.
+    
+    O cache fica no próprio browser (ou pool): não há referência global que
+    mantenha browsers fechados (e seus Chromes) vivos, nem limite de entradas.
+    
+    Args:
+        scraper_cls: Classe do scraper
+        browser_scraper: Instância do BrowserScraper (ou BrowserPool)
+        
+    Returns:
+        Instância reutilizável de scraper_cls
+    """
+    scrapers = vars(browser_scraper).setdefault("_scrapers_by_cls", {})
+    scraper = scrapers.get(scraper_cls)
+    if scraper is None:
+        scraper = scrapers[scraper_cls] = scraper_cls(browser_scraper)
+    return scraper
+
+
+def _job_key(scraper: BaseScraper, category: Optional[str]) -> str:
+    """Chave do resultado de um job: 'source_id' ou 'source_id:categoria'."""
+    return f"{scraper.source_id}:{category}" if category else scraper.source_id
+
+
+def _run_job(
+    browser_scraper,
+    scraper_cls: Type[BaseScraper],
+    category: Optional[str],
+    limit: int,
+) -> JobResult:
+    """Executa um job (fonte, categoria) com um browser dedicado, se houver pool."""
+    with _leased_browser(browser_scraper) as browser:
+        scraper = scraper_cls(browser)
+        try:
+            return JobResult(scraper.get_latest_articles(category=category, limit=limit))
+        except Exception as e:
+            logger.error(f"[{_job_key(scraper, category)}] Falha na coleta: {e}")
+            return JobResult(error=e)
+
+
+def _max_workers(browser_scraper, jobs: list) -> int:
+    """Paralelismo seguro: um job por browser do pool (1 sem pool)."""
+    pool_size = getattr(browser_scraper, "max_size", 1)
+    return max(1, min(len(jobs), pool_size))
+
+
+def scrape_many(
+    browser_scraper,
+    jobs: List[Tuple[Type[BaseScraper], Optional[str]]],
+    limit: int = 20,
+) -> Dict[Tuple[Type[BaseScraper], Optional[str]], JobResult]:
+    """
+    Coleta várias fontes/categorias em paralelo.
+    
+    Com um BrowserPool, cada job usa um browser próprio e até
+    ``pool.max_size`` jobs rodam ao mesmo tempo. Com um browser único, os
+    jobs rodam em sequência (um WebDriver não é thread-safe). A falha de um
+    job não interrompe os demais: ela fica em ``JobResult.error``.
+    
+    Args:
+        browser_scraper: BrowserPool ou instância do BrowserScraper
+        jobs: Lista de (classe do scraper, categoria)
+        limit: Número máximo de URLs por job
+        
+    Returns:
+        Dict {(classe do scraper, categoria): JobResult}, na ordem dos jobs
+        
+    Example:
+        >>> with BrowserPool(max_size=3) as pool:
+        ...     results = scrape_many(pool, [
+        ...         (ReutersScraper, "markets"),
+        ...         (WSJScraper, "markets"),
+        ...         (MarketWatchScraper, None),
+        ...     ])
+        >>> results[(WSJScraper, "markets")].urls
+    """
+    if not jobs:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=_max_workers(browser_scraper, jobs)) as executor:
+        futures = [
+            executor.submit(_run_job, browser_scraper, scraper_cls, category, limit)
+            for scraper_cls, category in jobs
+        ]
+        return {tuple(job): f.result() for job, f in zip(jobs, futures)}
+
+
+async def scrape_many_async(
+    browser_scraper,
+    jobs: List[Tuple[Type[BaseScraper], Optional[str]]],
+    limit: int = 20,
+) -> Dict[Tuple[Type[BaseScraper], Optional[str]], JobResult]:
+    """
+    Versão asyncio de scrape_many (Selenium roda em threads via asyncio.to_thread).
+    
+    Args:
+        browser_scraper: BrowserPool ou instância do BrowserScraper
+        jobs: Lista de (classe do scraper, categoria)
+        limit: Número máximo de URLs por job
+        
+    Returns:
+        Dict {(classe do scraper, categoria): JobResult}, na ordem dos jobs
+    """
+    if not jobs:
+        return {}
+    
+    semaphore = asyncio.Semaphore(_max_workers(browser_scraper, jobs))
+    
+    async def run(scraper_cls, category):
+        async with semaphore:
+            return await asyncio.to_thread(_run_job, browser_scraper, scraper_cls, category, limit)
+    
+    results = await asyncio.gather(*(run(cls, category) for cls, category in jobs))
+    return {tuple(job): result for job, result in zip(jobs, results)}
@@ -13,7 +13,7 @@ from typing import Optional, List
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, get_scraper
 
 logger = logging.getLogger(__name__)
 
@@ -180,5 +180,5 @@ def scrape_bloomberg_latam(
         >>> browser = BrowserScraper()
         >>> urls = scrape_bloomberg_latam(browser, category="latinamerica", limit=10)
     """
-    scraper = BloombergLatAmScraper(browser_scraper)
+    scraper = get_scraper(BloombergLatAmScraper, browser_scraper)
     return scraper.get_latest_articles(category=category, limit=limit)
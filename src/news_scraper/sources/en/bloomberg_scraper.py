@@ -12,11 +12,12 @@ Características:
 """
 
 from __future__ import annotations
+import re
 from typing import Literal, List, Optional
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,14 @@ class BloombergScraper(BaseScraper):
     MIN_SUCCESS_RATE = 0.5  # 50%
     HAS_PAYWALL = False
     
+    # Páginas de navegação/redes sociais (regex pré-compilada, sem diferenciar caixa)
+    _REJECT_RE = compile_url_filter(
+        r"/autor/|/colunista/|/tag/|/busca/|/search/|/about/|/sobre/"
+        r"|/contato/|/newsletter/|utm_|facebook|twitter|linkedin"
+        r"|assine|cadastro|register|subscribe",
+        re.IGNORECASE,
+    )
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="bloomberg")
@@ -64,30 +73,17 @@ class BloombergScraper(BaseScraper):
         # Scroll para carregar mais conteúdo
         self.scraper.scroll_and_load(scroll_pause=2.0, max_scrolls=4)
         
-        # Extrair todos os links
-        all_links = self.scraper.driver.find_elements('css selector', 'a')
+        # Extrair links do domínio (com mais de 50 caracteres e sem páginas de
+        # navegação) em uma única chamada JavaScript
+        hrefs = self._dom_hrefs(self.scraper.driver, 'bloomberg.com.br', min_length=50)
         
         article_urls: set[str] = set()
         
-        for link in all_links:
-            href = link.get_attribute('href')
-            
-            if not href or 'bloomberg.com.br' not in href:
-                continue
-            
+        for href in hrefs:
             # URLs de artigos Bloomberg geralmente têm estrutura específica
             # Ex: /news/articles/YYYY-MM-DD/titulo-da-noticia
             if '/news/' in href or '/artigo/' in href or '/noticias/' in href:
-                # URLs de artigos são razoavelmente longas
-                if len(href) > 50:
-                    # Excluir páginas de navegação e especiais
-                    if not any(x in href.lower() for x in [
-                        '/autor/', '/colunista/', '/tag/', '/busca/', '/search/',
-                        '/about/', '/sobre/', '/contato/', '/newsletter/',
-                        'utm_', 'facebook', 'twitter', 'linkedin',
-                        'assine', 'cadastro', 'register', 'subscribe'
-                    ]):
-                        article_urls.add(href)
+                article_urls.add(self._intern(href))
             
             if len(article_urls) >= limit * 2:
                 break
@@ -14,7 +14,7 @@ from typing import Optional, List
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, get_scraper
 
 logger = logging.getLogger(__name__)
 
@@ -193,5 +193,5 @@ def scrape_business_insider(
         >>> browser = BrowserScraper()
         >>> urls = scrape_business_insider(browser, category="markets", limit=10)
     """
-    scraper = BusinessInsiderScraper(browser_scraper)
+    scraper = get_scraper(BusinessInsiderScraper, browser_scraper)
     return scraper.get_latest_articles(category=category, limit=limit)
@@ -108,6 +108,9 @@ class EconomistScraper(BaseScraper):
             # Coletar links
             urls = set()
             for selector in self.SELECTORS["article_links"]:
+                # Evita find_elements para seletores que não serão usados
+                if len(urls) >= limit:
+                    break
                 try:
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     for elem in elements:
@@ -121,9 +124,6 @@ class EconomistScraper(BaseScraper):
                 except Exception as e:
                     logger.debug(f"Selector {selector} failed: {e}")
                     continue
-                
-                if len(urls) >= limit:
-                    break
             
             result = list(urls)[:limit]
             logger.info(f"Found {len(result)} The Economist articles")
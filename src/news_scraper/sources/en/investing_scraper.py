@@ -4,20 +4,40 @@ Specialized scraper for Investing.com News section.
 
 Section:
 - News: https://www.investing.com/news
+
+Dica de performance: reutilize a mesma instância de browser entre coletas.
+Iniciar o Chrome custa alguns segundos e domina coletas curtas;
+scrape_investing_com mantém o scraper em cache por browser.
 """
 
 from __future__ import annotations
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-from typing import Optional, List
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.parse import urljoin, urlsplit
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from typing import ClassVar, Optional, List
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter, get_scraper
 
 logger = logging.getLogger(__name__)
 
 
+# Seletores de links de artigos: constantes imutáveis, combinadas uma única vez
+_ARTICLE_LINK_SELECTORS = (
+    "article a[data-test='article-title-link']",
+    "div.largeTitle article a",
+    "div.mediumTitle1 article a",
+    "a.title",
+    "article.js-article-item a",
+)
+_ARTICLE_LINK_SELECTOR = ", ".join(_ARTICLE_LINK_SELECTORS)
+
+
 class InvestingComScraper(BaseScraper):
     """Scraper para Investing.com News."""
 
@@ -37,13 +57,7 @@ class InvestingComScraper(BaseScraper):
     }
     
     SELECTORS = {
-        "article_links": [
-            "article a[data-test='article-title-link']",
-            "div.largeTitle article a",
-            "div.mediumTitle1 article a",
-            "a.title",
-            "article.js-article-item a",
-        ],
+        "article_links": _ARTICLE_LINK_SELECTORS,
         "title": [
             "h1",
             "h1.articleHeader",
@@ -62,6 +76,28 @@ class InvestingComScraper(BaseScraper):
         ],
     }
 
+    # Seletores de links combinados: uma única travessia do DOM
+    COMBINED_LINK_SELECTOR = _ARTICLE_LINK_SELECTOR
+
+    # Parse parcial: só <article> e <a> (com seus filhos) entram na árvore.
+    # Sem os <div> ancestrais, "div.largeTitle article a" e
+    # "div.mediumTitle1 article a" viram "article a" (superconjunto).
+    _LINK_STRAINER = SoupStrainer(["article", "a"])
+    _STRAINED_LINK_MATCHER = soupsieve.compile("article a, a.title")
+
+    # Filtros de URL pré-compilados (uma única varredura em C por href)
+    _SKIP_RE = compile_url_filter(
+        r"#|\?|/pro/|/academy/|/tools/|login|signin|register|subscribe"
+        r"|/analysis/|/opinion/|/video/"
+    )
+    _HAS_DIGIT_RE = re.compile(r"\d")
+
+    # Cache de listagens já processadas (compartilhado entre instâncias e
+    # threads de scrape_many; todo acesso passa por _LISTING_CACHE_LOCK)
+    LISTING_CACHE_SIZE = 32
+    _LISTING_CACHE: ClassVar[OrderedDict[tuple[str, int], List[str]]] = OrderedDict()
+    _LISTING_CACHE_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, browser_scraper):
         """Inicializa o scraper."""
         super().__init__(browser_scraper, source_id="investing")
@@ -96,55 +132,76 @@ class InvestingComScraper(BaseScraper):
             html = self.scraper.get_page(url, wait_time=5)
             
             # Scroll para carregar mais conteúdo
-            html = self.scraper.scroll_and_load(scroll_pause=3.0, max_scrolls=5)
+            html = self.scraper.scroll_and_load(
+                scroll_pause=3.0, max_scrolls=5, wait_strategy="network_idle"
+            )
             
-            soup = BeautifulSoup(html, "lxml")
-            urls: set[str] = set()
-
-            # Tenta todos os seletores de links
-            for selector in self.SELECTORS["article_links"]:
-                links = soup.select(selector)
-                
-                for link in links:
-                    href = link.get("href", "")
-                    
-                    if not href:
-                        continue
-                    
-                    # Evita URLs indesejadas
-                    if any(skip in href for skip in [
-                        "#", "?", "/pro/", "/academy/", "/tools/",
-                        "login", "signin", "register", "subscribe",
-                        "/analysis/", "/opinion/", "/video/"
-                    ]):
-                        continue
-                    
-                    # Aceita apenas artigos de notícias
-                    # Investing.com usa padrão: /news/something/article-title-12345
-                    if "/news/" in href:
-                        full_url = urljoin(self.BASE_URL, href)
-                        
-                        # Remove query params
-                        full_url = full_url.split("?")[0].split("#")[0]
-                        
-                        # Valida domínio e formato
-                        if "investing.com" in full_url and full_url.startswith("http"):
-                            # Garante que é um artigo (tem ID numérico no final)
-                            if any(char.isdigit() for char in full_url.split("/")[-1]):
-                                urls.add(full_url)
-                    
-                    if len(urls) >= limit:
-                        break
-                
-                if len(urls) >= limit:
-                    break
-
-            return sorted(list(urls))[:limit]
+            return self._parse_listing(html, limit)
 
         except Exception as e:
             logger.error(f"Erro ao coletar URLs do Investing.com: {e}")
             return []
 
+    def _parse_listing(self, html: str, limit: int) -> List[str]:
+        """
+        Extrai URLs de artigos do HTML da listagem.
+        
+        O resultado é memoizado pelo hash do conteúdo: polls repetidos que
+        retornam a mesma listagem não pagam o parse novamente.
+        
+        Args:
+            html: HTML renderizado da listagem
+            limit: Número máximo de URLs
+            
+        Returns:
+            Lista de URLs de artigos
+        """
+        key = (hashlib.blake2b(html.encode(), digest_size=16).hexdigest(), limit)
+        with self._LISTING_CACHE_LOCK:
+            cached = self._LISTING_CACHE.get(key)
+            if cached is not None:
+                self._LISTING_CACHE.move_to_end(key)
+                return list(cached)
+
+        soup = BeautifulSoup(html, "lxml", parse_only=self._LINK_STRAINER)
+        urls: dict[str, None] = {}
+
+        # Um único seletor combinado percorre o DOM uma só vez
+        for link in self._STRAINED_LINK_MATCHER.select(soup):
+            href = link.get("href", "")
+            
+            if not href:
+                continue
+            
+            # Evita URLs indesejadas
+            if self._SKIP_RE.search(href):
+                continue
+            
+            # Aceita apenas artigos de notícias
+            # Investing.com usa padrão: /news/something/article-title-12345
+            if "/news/" in href:
+                # Um único parse: domínio, esquema e path sem query/fragmento
+                parts = urlsplit(urljoin(self.BASE_URL, href))
+                
+                # Valida domínio e formato
+                if parts.netloc.endswith("investing.com") and parts.scheme in ("http", "https"):
+                    # Garante que é um artigo (tem ID numérico no final)
+                    if self._HAS_DIGIT_RE.search(parts.path.rsplit("/", 1)[-1]):
+                        urls[f"{parts.scheme}://{parts.netloc}{parts.path}"] = None
+            
+            if len(urls) >= limit:
+                break
+
+        # Ordem de aparição na página (mais destaque primeiro)
+        result = list(urls)[:limit]
+        
+        with self._LISTING_CACHE_LOCK:
+            self._LISTING_CACHE[key] = result
+            if len(self._LISTING_CACHE) > self.LISTING_CACHE_SIZE:
+                self._LISTING_CACHE.popitem(last=False)
+        
+        return list(result)
+
     def get_article_urls(self, category: str = "news", limit: int = 20) -> List[str]:
         """
         Alias para get_latest_articles (compatibilidade).
@@ -168,7 +225,8 @@ def scrape_investing_com(
     Função de conveniência para scraping rápido do Investing.com.
     
     Args:
-        browser_scraper: Instância do browser scraper
+        browser_scraper: Instância do browser scraper (reutilize a mesma
+            entre chamadas: o scraper fica em cache por browser)
         category: Categoria específica (news, stock-market-news, economy)
         limit: Número máximo de URLs
         
@@ -182,5 +240,5 @@ def scrape_investing_com(
         >>> browser = BrowserScraper()
         >>> urls = scrape_investing_com(browser, category="stock-market-news", limit=10)
     """
-    scraper = InvestingComScraper(browser_scraper)
+    scraper = get_scraper(InvestingComScraper, browser_scraper)
     return scraper.get_latest_articles(category=category, limit=limit)
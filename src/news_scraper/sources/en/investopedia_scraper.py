@@ -18,11 +18,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
 
+# Seletores de links de artigos: constantes imutáveis, combinadas uma única vez
+_ARTICLE_LINK_SELECTORS = (
+    "a.card-title",
+    "a.comp.mntl-card-list-items",
+    "h3 a",
+)
+_ARTICLE_LINK_SELECTOR = ", ".join(_ARTICLE_LINK_SELECTORS)
+
+
 class InvestopediaScraper(BaseScraper):
     """Scraper especializado para Investopedia."""
     
@@ -38,11 +47,7 @@ class InvestopediaScraper(BaseScraper):
     }
     
     SELECTORS = {
-        "article_links": [
-            "a.card-title",
-            "a.comp.mntl-card-list-items",
-            "h3 a",
-        ],
+        "article_links": _ARTICLE_LINK_SELECTORS,
         "title": [
             "h1#article-heading",
             "h1.article-heading",
@@ -61,6 +66,13 @@ class InvestopediaScraper(BaseScraper):
         ],
     }
     
+    # Seletores de links combinados: uma única travessia do DOM
+    COMBINED_LINK_SELECTOR = _ARTICLE_LINK_SELECTOR
+    
+    # Links do Investopedia, sem páginas especiais (tutoriais, termos, etc)
+    _ACCEPT_RE = compile_url_filter(r"investopedia\.com")
+    _REJECT_RE = compile_url_filter(r"/terms/|(?i:/what-is)")
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="investopedia")
@@ -93,42 +105,21 @@ class InvestopediaScraper(BaseScraper):
         url = self.CATEGORIES[category]
         logger.info(f"Fetching Investopedia articles from {category}: {url}")
         
-        driver = self.scraper.driver
-        
         try:
-            driver.get(url)
-            
-            # Esperar carregar
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "article"))
-            )
-            
-            # Scroll
-            self.scraper._scroll_page(driver, scroll_times=2)
-            
-            # Coletar links
-            urls = set()
-            for selector in self.SELECTORS["article_links"]:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        href = elem.get_attribute("href")
-                        if href and "investopedia.com" in href:
-                            # Filtrar páginas especiais (tutoriais, termos, etc)
-                            if "/terms/" not in href and "/what-is" not in href.lower():
-                                urls.add(href)
-                                if len(urls) >= limit:
-                                    break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            with self._browser() as browser:
+                driver = browser.driver
                 
-                if len(urls) >= limit:
-                    break
-            
-            result = list(urls)[:limit]
-            logger.info(f"Found {len(result)} Investopedia articles")
-            return result
+                driver.get(url)
+                
+                # Esperar o primeiro link de artigo (não só o esqueleto da página)
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.COMBINED_LINK_SELECTOR))
+                )
+                
+                # Coletar links (rola a página só enquanto faltarem URLs)
+                result = self._harvest_links(driver, limit)
+                logger.info(f"Found {len(result)} Investopedia articles")
+                return result
         
         except Exception as e:
             logger.error(f"Error fetching Investopedia articles: {e}")
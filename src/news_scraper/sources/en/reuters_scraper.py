@@ -12,17 +12,27 @@ Características:
 from __future__ import annotations
 
 import logging
+import re
 from typing import Optional, List
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
 
+# Seletores de links de artigos: constantes imutáveis, combinadas uma única vez
+_ARTICLE_LINK_SELECTORS = (
+    "a[data-testid='Heading']",
+    "a.text__text__1FZLe",
+    "h3 a",
+)
+_ARTICLE_LINK_SELECTOR = ", ".join(_ARTICLE_LINK_SELECTORS)
+
+
 class ReutersScraper(BaseScraper):
     """Scraper especializado para Reuters."""
     
@@ -39,11 +49,7 @@ class ReutersScraper(BaseScraper):
     }
     
     SELECTORS = {
-        "article_links": [
-            "a[data-testid='Heading']",
-            "a.text__text__1FZLe",
-            "h3 a",
-        ],
+        "article_links": _ARTICLE_LINK_SELECTORS,
         "title": [
             "h1[data-testid='Heading']",
             "h1.article-header__title",
@@ -63,6 +69,14 @@ class ReutersScraper(BaseScraper):
         ],
     }
     
+    # Seletores de links combinados: uma única travessia do DOM
+    COMBINED_LINK_SELECTOR = _ARTICLE_LINK_SELECTOR
+    MAX_SCROLLS = 3
+    
+    # Artigos de notícias, sem anúncios e vídeos
+    _ACCEPT_RE = compile_url_filter(r"/(?:article|markets|business)/")
+    _REJECT_RE = compile_url_filter(r"sponsored|video", re.IGNORECASE)
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="reuters")
@@ -96,42 +110,21 @@ class ReutersScraper(BaseScraper):
         url = self.CATEGORIES[category]
         logger.info(f"Fetching Reuters articles from {category}: {url}")
         
-        driver = self.scraper.driver
-        
         try:
-            driver.get(url)
-            
-            # Esperar carregar
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "article"))
-            )
-            
-            # Scroll para carregar mais
-            self.scraper._scroll_page(driver, scroll_times=3)
-            
-            # Coletar links
-            urls = set()
-            for selector in self.SELECTORS["article_links"]:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        href = elem.get_attribute("href")
-                        if href and ("/article/" in href or "/markets/" in href or "/business/" in href):
-                            # Filtrar anúncios e páginas especiais
-                            if "sponsored" not in href.lower() and "video" not in href.lower():
-                                urls.add(href)
-                                if len(urls) >= limit:
-                                    break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            with self._browser() as browser:
+                driver = browser.driver
                 
-                if len(urls) >= limit:
-                    break
-            
-            result = list(urls)[:limit]
-            logger.info(f"Found {len(result)} Reuters articles")
-            return result
+                driver.get(url)
+                
+                # Esperar o primeiro link de artigo (não só o esqueleto da página)
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.COMBINED_LINK_SELECTOR))
+                )
+                
+                # Coletar links (rola a página só enquanto faltarem URLs)
+                result = self._harvest_links(driver, limit)
+                logger.info(f"Found {len(result)} Reuters articles")
+                return result
         
         except Exception as e:
             logger.error(f"Error collecting Reuters URLs: {e}")
@@ -17,11 +17,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
 
+# Seletores de links de artigos: constantes imutáveis, combinadas uma única vez
+_ARTICLE_LINK_SELECTORS = (
+    "a.WSJTheme--headline--unZqjb45",
+    "a[data-type='article']",
+    "h3.WSJTheme--headline--unZqjb45 a",
+)
+_ARTICLE_LINK_SELECTOR = ", ".join(_ARTICLE_LINK_SELECTORS)
+
+
 class WSJScraper(BaseScraper):
     """Scraper especializado para Wall Street Journal."""
     
@@ -39,11 +48,7 @@ class WSJScraper(BaseScraper):
     }
     
     SELECTORS = {
-        "article_links": [
-            "a.WSJTheme--headline--unZqjb45",
-            "a[data-type='article']",
-            "h3.WSJTheme--headline--unZqjb45 a",
-        ],
+        "article_links": _ARTICLE_LINK_SELECTORS,
         "title": [
             "h1.wsj-article-headline",
             "h1[data-testid='headline']",
@@ -64,6 +69,12 @@ class WSJScraper(BaseScraper):
         ],
     }
     
+    # Seletores de links combinados: uma única travessia do DOM
+    COMBINED_LINK_SELECTOR = _ARTICLE_LINK_SELECTOR
+    
+    # Apenas artigos (/articles/)
+    _ACCEPT_RE = compile_url_filter(r"/articles/")
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="wsj")
@@ -97,40 +108,21 @@ class WSJScraper(BaseScraper):
         url = self.CATEGORIES[category]
         logger.info(f"Fetching WSJ articles from {category}: {url}")
         
-        driver = self.scraper.driver
-        
         try:
-            driver.get(url)
-            
-            # Esperar carregar
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "article"))
-            )
-            
-            # Scroll
-            self.scraper._scroll_page(driver, scroll_times=2)
-            
-            # Coletar links
-            urls = set()
-            for selector in self.SELECTORS["article_links"]:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        href = elem.get_attribute("href")
-                        if href and "/articles/" in href:
-                            urls.add(href)
-                            if len(urls) >= limit:
-                                break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            with self._browser() as browser:
+                driver = browser.driver
                 
-                if len(urls) >= limit:
-                    break
-            
-            result = list(urls)[:limit]
-            logger.info(f"Found {len(result)} WSJ articles")
-            return result
+                driver.get(url)
+                
+                # Esperar o primeiro link de artigo (não só o esqueleto da página)
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.COMBINED_LINK_SELECTOR))
+                )
+                
+                # Coletar links (rola a página só enquanto faltarem URLs)
+                result = self._harvest_links(driver, limit)
+                logger.info(f"Found {len(result)} WSJ articles")
+                return result
         
         except Exception as e:
             logger.error(f"Error collecting WSJ URLs: {e}")
@@ -8,13 +8,20 @@ Sections:
 """
 
 from __future__ import annotations
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-from typing import Optional, List
+from urllib.parse import urljoin, urlsplit
+from bs4 import BeautifulSoup, Tag
+import soupsieve
+from typing import Dict, Iterator, Optional, List
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+try:
+    # Parser HTML5 em C (lexbor): muito mais rápido que BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # dependência opcional: pip install news-scraper[fast]
+    LexborHTMLParser = None
+
+from ..base_scraper import BaseScraper, compile_url_filter, get_scraper
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,17 @@ class YahooFinanceUSScraper(BaseScraper):
         "news": "https://finance.yahoo.com/news/",
     }
     
+    # Filtros de URL compilados uma única vez (uma passada por href):
+    # regex para trechos em qualquer posição, frozenset para segmentos exatos
+    _REJECT_RE = compile_url_filter(
+        r"[?#]|/finance\.yahoo\.com/m/|login|signin|subscribe|newsletter"
+    )
+    _SKIP_SEGMENTS = frozenset({"video", "videos", "search"})
+    _ACCEPT_RE = compile_url_filter(
+        r"/news/|/story/|finance\.yahoo\.com/(?:news|m/)"
+        r"|/[a-z0-9-]{8,}-[a-z0-9]+\.html$"  # slug de artigo fora de /news/
+    )
+    
     SELECTORS = {
         "article_links": [
             "h3 a",
@@ -59,6 +77,18 @@ class YahooFinanceUSScraper(BaseScraper):
         ],
     }
 
+    # Seletores de links combinados: uma única travessia do DOM
+    COMBINED_LINK_SELECTOR = ", ".join(SELECTORS["article_links"])
+
+    # Seletores pré-compilados (soupsieve) uma única vez, no carregamento da classe.
+    # Links usam o seletor combinado; os demais grupos mantêm a ordem de prioridade.
+    _LINK_MATCHER = soupsieve.compile(COMBINED_LINK_SELECTOR)
+    _MATCHERS = {
+        group: tuple(soupsieve.compile(selector) for selector in selectors)
+        for group, selectors in SELECTORS.items()
+        if group != "article_links"
+    }
+
     def __init__(self, browser_scraper):
         """Inicializa o scraper."""
         super().__init__(browser_scraper, source_id="yahoofinance")
@@ -95,49 +125,125 @@ class YahooFinanceUSScraper(BaseScraper):
             # Scroll para carregar mais conteúdo
             html = self.scraper.scroll_and_load(scroll_pause=3.0, max_scrolls=5)
             
-            soup = BeautifulSoup(html, "lxml")
-            urls: set[str] = set()
+            # Dict mantém a ordem de descoberta na página (sem ordenar no fim)
+            urls: dict[str, None] = {}
 
-            # Tenta todos os seletores de links
-            for selector in self.SELECTORS["article_links"]:
-                links = soup.select(selector)
+            for href in self._iter_link_hrefs(html):
+                if not href:
+                    continue
                 
-                for link in links:
-                    href = link.get("href", "")
-                    
-                    if not href:
-                        continue
+                # Evita URLs indesejadas
+                if self._REJECT_RE.search(href):
+                    continue
+                if not self._SKIP_SEGMENTS.isdisjoint(urlsplit(href).path.split("/")):
+                    continue
+                
+                # Aceita URLs de notícias
+                if self._ACCEPT_RE.search(href):
+                    # Evita urljoin nos casos comuns (absoluto ou relativo à raiz)
+                    if href.startswith("http"):
+                        full_url = href
+                    elif href.startswith("/") and not href.startswith("//"):
+                        full_url = self.BASE_URL + href
+                    else:
+                        full_url = urljoin(self.BASE_URL, href)
                     
-                    # Evita URLs indesejadas
-                    if any(skip in href for skip in [
-                        "?", "#", "/video", "/videos", "/search", "/finance.yahoo.com/m/",
-                        "login", "signin", "subscribe", "newsletter"
-                    ]):
-                        continue
+                    # Remove fragmento e query params ("#" antes de "?" também funciona)
+                    full_url = full_url.partition("#")[0].partition("?")[0]
                     
-                    # Aceita URLs de notícias
-                    if any(pattern in href for pattern in [
-                        "/news/", "/story/", "finance.yahoo.com/news",
-                        "finance.yahoo.com/m/", "-"  # Yahoo usa slugs com hífens
-                    ]):
-                        full_url = urljoin(self.BASE_URL, href)
-                        
-                        # Remove query params
-                        full_url = full_url.split("?")[0].split("#")[0]
-                        
-                        # Valida domínio
-                        if "finance.yahoo.com" in full_url:
-                            urls.add(full_url)
-                
-                if len(urls) >= limit:
-                    break
+                    # Valida domínio
+                    if "finance.yahoo.com" in full_url:
+                        urls[self._intern(full_url)] = None
+                        if len(urls) >= limit:
+                            break
 
-            return sorted(list(urls))[:limit]
+            return list(urls)
 
         except Exception as e:
             logger.error(f"Erro ao coletar URLs do Yahoo Finance US: {e}")
             return []
     
+    def _iter_link_hrefs(self, html: str) -> Iterator[str]:
+        """
+        Itera os hrefs dos links de artigos da listagem.
+        
+        Usa selectolax (lexbor) quando instalado; senão, BeautifulSoup.
+        Em ambos os casos o DOM é percorrido uma única vez.
+        """
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html)
+            for node in tree.css(self.COMBINED_LINK_SELECTOR):
+                yield node.attributes.get("href") or ""
+        else:
+            soup = BeautifulSoup(html, "lxml")
+            for link in self._LINK_MATCHER.select(soup):
+                yield link.get("href", "")
+    
+    def _parse_article(self, html: str) -> Dict[str, Optional[Tag]]:
+        """
+        Faz o parse do artigo uma única vez e resolve todos os grupos de seletores.
+        
+        Título, corpo e data são lidos da mesma árvore; cada grupo fica com
+        o primeiro seletor (em ordem de prioridade) que encontrar algo.
+        
+        Returns:
+            Dict grupo (title, body, date) -> elemento encontrado ou None
+        """
+        soup = BeautifulSoup(html, "lxml")
+        parsed: Dict[str, Optional[Tag]] = {}
+        for group, matchers in self._MATCHERS.items():
+            parsed[group] = None
+            for matcher in matchers:
+                element = matcher.select_one(soup)
+                if element is not None:
+                    parsed[group] = element
+                    break
+        return parsed
+    
+    def _extract_title(self, parsed: Dict[str, Optional[Tag]]) -> Optional[str]:
+        """Título do artigo já parseado."""
+        element = parsed.get("title")
+        return element.get_text(strip=True) if element is not None else None
+    
+    def _extract_body(self, parsed: Dict[str, Optional[Tag]]) -> Optional[str]:
+        """Texto do corpo (parágrafos separados por linha em branco)."""
+        element = parsed.get("body")
+        if element is None:
+            return None
+        paragraphs = [p.get_text(" ", strip=True) for p in element.find_all("p")]
+        text = "\n\n".join(p for p in paragraphs if p) or element.get_text("\n", strip=True)
+        return text or None
+    
+    def _extract_date(self, parsed: Dict[str, Optional[Tag]]) -> Optional[str]:
+        """Data de publicação (atributo datetime, se houver)."""
+        element = parsed.get("date")
+        if element is None:
+            return None
+        return element.get("datetime") or element.get_text(strip=True) or None
+    
+    def _extract_fields(self, url: str) -> dict:
+        """
+        Extrai os campos de um artigo (título, corpo e data).
+        
+        O HTML é parseado uma única vez (_parse_article) e compartilhado
+        pelos extratores de título, corpo e data.
+        
+        Args:
+            url: URL do artigo
+            
+        Returns:
+            Dict com url, title, text, date e source
+        """
+        html = self.scraper.get_page(url, wait_time=3)
+        parsed = self._parse_article(html)
+        return {
+            "url": url,
+            "title": self._extract_title(parsed),
+            "text": self._extract_body(parsed),
+            "date": self._extract_date(parsed),
+            "source": "Yahoo Finance",
+        }
+    
     def get_article_urls(self, category: str = "stock-market-news", limit: int = 20) -> List[str]:
         """
         Alias para get_latest_articles (compatibilidade).
@@ -175,5 +281,5 @@ def scrape_yahoo_finance_us(
         >>> browser = BrowserScraper()
         >>> urls = scrape_yahoo_finance_us(browser, category="stock-market-news", limit=10)
     """
-    scraper = YahooFinanceUSScraper(browser_scraper)
+    scraper = get_scraper(YahooFinanceUSScraper, browser_scraper)
     return scraper.get_latest_articles(category=category, limit=limit)
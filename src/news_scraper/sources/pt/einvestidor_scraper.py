@@ -12,11 +12,12 @@ Características:
 """
 
 from __future__ import annotations
+import re
 from typing import Literal, List, Optional
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,13 @@ class EInvestidorScraper(BaseScraper):
     MIN_SUCCESS_RATE = 0.5  # 50%
     HAS_PAYWALL = False
     
+    # Páginas de navegação/redes sociais (regex pré-compilada, sem diferenciar caixa)
+    _REJECT_RE = compile_url_filter(
+        r"/autor/|/tag/|/page/|/busca/|/search/|/sobre/|/contato/"
+        r"|/newsletter/|utm_|facebook|twitter|linkedin|assine|cadastro",
+        re.IGNORECASE,
+    )
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="einvestidor")
@@ -64,41 +72,29 @@ class EInvestidorScraper(BaseScraper):
         # Scroll para carregar mais conteúdo
         self.scraper.scroll_and_load(scroll_pause=1.5, max_scrolls=3)
         
-        # Extrair todos os links
-        all_links = self.scraper.driver.find_elements('css selector', 'a')
+        # Filtrar no navegador (domínio, tamanho e navegação): só candidatos cruzam o WebDriver
+        hrefs = self._dom_hrefs(self.scraper.driver, "einvestidor.estadao.com.br", min_length=60)
         
-        article_urls: set[str] = set()
+        # Dict mantém a ordem de descoberta na página (sem ordenar no fim)
+        article_urls: dict[str, None] = {}
         
-        for link in all_links:
-            href = link.get_attribute('href')
-            
-            if not href or 'einvestidor.estadao.com.br' not in href:
-                continue
-            
+        for href in hrefs:
             # URLs de artigos são longas (> 60 chars) e têm estrutura /categoria/titulo-slug/
-            if len(href) > 60 and href.count('/') >= 4:
+            if href.count('/') >= 4:
                 # Filtrar por categoria se especificada
                 if category and f'/{category}/' not in href:
                     continue
                 
-                # Excluir páginas de navegação
-                if not any(x in href.lower() for x in [
-                    '/autor/', '/tag/', '/page/', '/busca/', '/search/',
-                    '/sobre/', '/contato/', '/newsletter/',
-                    'utm_', 'facebook', 'twitter', 'linkedin',
-                    'assine', 'cadastro'
-                ]):
-                    article_urls.add(href)
+                article_urls[self._intern(href)] = None
             
-            if len(article_urls) >= limit * 2:
+            if len(article_urls) >= limit:
                 break
         
-        # Ordenar e limitar
-        sorted_urls = sorted(article_urls)[:limit]
+        urls = list(article_urls)
         
-        logger.info(f"✓ {len(sorted_urls)} URLs encontradas")
+        logger.info(f"✓ {len(urls)} URLs encontradas")
         
-        return sorted_urls
+        return urls
     
     def get_investimentos_articles(self, limit: int = 20) -> list[str]:
         """Atalho para artigos de Investimentos."""
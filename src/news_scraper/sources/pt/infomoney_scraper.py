@@ -12,11 +12,12 @@ Características:
 """
 
 from __future__ import annotations
+import re
 from typing import Literal, List, Optional
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,13 @@ class InfoMoneyScraper(BaseScraper):
     MIN_SUCCESS_RATE = 0.6  # 60% - site brasileiro estável
     HAS_PAYWALL = False
     
+    # Páginas de navegação/redes sociais (regex pré-compilada, sem diferenciar caixa)
+    _REJECT_RE = compile_url_filter(
+        r"/autor/|/tag/|/page/|/busca/|/search/|utm_|facebook|twitter"
+        r"|linkedin",
+        re.IGNORECASE,
+    )
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="infomoney")
@@ -64,39 +72,29 @@ class InfoMoneyScraper(BaseScraper):
         # Scroll para carregar mais conteúdo
         self.scraper.scroll_and_load(scroll_pause=1.5, max_scrolls=3)
         
-        # Extrair todos os links
-        all_links = self.scraper.driver.find_elements('css selector', 'a')
+        # Filtrar no navegador (domínio, tamanho e navegação): só candidatos cruzam o WebDriver
+        hrefs = self._dom_hrefs(self.scraper.driver, "infomoney.com.br", min_length=60)
         
-        article_urls: set[str] = set()
+        # Dict mantém a ordem de descoberta na página (sem ordenar no fim)
+        article_urls: dict[str, None] = {}
         
-        for link in all_links:
-            href = link.get_attribute('href')
-            
-            if not href or 'infomoney.com.br' not in href:
-                continue
-            
+        for href in hrefs:
             # Filtrar por categoria se especificada
             if category and f'/{category}/' not in href:
                 continue
             
             # URLs de artigos são longas (> 60 chars) e têm estrutura /categoria/titulo-slug/
-            if len(href) > 60 and href.count('/') >= 4:
-                # Excluir páginas de navegação
-                if not any(x in href.lower() for x in [
-                    '/autor/', '/tag/', '/page/', '/busca/', '/search/',
-                    'utm_', 'facebook', 'twitter', 'linkedin'
-                ]):
-                    article_urls.add(href)
+            if href.count('/') >= 4:
+                article_urls[self._intern(href)] = None
             
-            if len(article_urls) >= limit * 2:  # Coletar extras para filtrar depois
+            if len(article_urls) >= limit:
                 break
         
-        # Ordenar e limitar
-        sorted_urls = sorted(article_urls)[:limit]
+        urls = list(article_urls)
         
-        logger.info(f"✓ {len(sorted_urls)} URLs encontradas")
+        logger.info(f"✓ {len(urls)} URLs encontradas")
         
-        return sorted_urls
+        return urls
     
     def get_mercados_articles(self, limit: int = 20) -> list[str]:
         """Atalho para artigos de Mercados."""
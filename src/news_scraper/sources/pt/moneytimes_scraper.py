@@ -13,11 +13,12 @@ Características:
 """
 
 from __future__ import annotations
+import re
 from typing import List, Optional
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,14 @@ class MoneyTimesScraper(BaseScraper):
     MIN_SUCCESS_RATE = 0.6  # 60%
     HAS_PAYWALL = False
     
+    # Páginas de navegação/redes sociais (regex pré-compilada, sem diferenciar caixa)
+    _REJECT_RE = compile_url_filter(
+        r"/autor/|/tag/|/categoria/|/page/|/busca/|/search/|/sobre/"
+        r"|/contato/|/central-de-|/cotacoes/|/monitor-|utm_|facebook"
+        r"|twitter|linkedin|newsletter|cadastro",
+        re.IGNORECASE,
+    )
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="moneytimes")
@@ -60,39 +69,26 @@ class MoneyTimesScraper(BaseScraper):
         # Scroll para carregar mais conteúdo
         self.scraper.scroll_and_load(scroll_pause=1.0, max_scrolls=2)
         
-        # Extrair todos os links
-        all_links = self.scraper.driver.find_elements('css selector', 'a')
+        # Filtrar no navegador (domínio, tamanho e navegação): só candidatos cruzam o WebDriver
+        hrefs = self._dom_hrefs(self.scraper.driver, "moneytimes.com.br", min_length=50)
         
-        article_urls: set[str] = set()
+        # Dict mantém a ordem de descoberta na página (sem ordenar no fim)
+        article_urls: dict[str, None] = {}
         
-        for link in all_links:
-            href = link.get_attribute('href')
-            
-            if not href or 'moneytimes.com.br' not in href:
-                continue
-            
+        for href in hrefs:
             # URLs de artigos são longas (> 50 chars) e terminam com código
             # Exemplos: -igdl/, -lmrs/, -jals/, -mabe/
-            if len(href) > 50 and '-' in href.split('/')[-2]:
-                # Excluir páginas de navegação e páginas especiais
-                if not any(x in href.lower() for x in [
-                    '/autor/', '/tag/', '/categoria/', '/page/', 
-                    '/busca/', '/search/', '/sobre/', '/contato/',
-                    '/central-de-', '/cotacoes/', '/monitor-',
-                    'utm_', 'facebook', 'twitter', 'linkedin',
-                    'newsletter', 'cadastro'
-                ]):
-                    article_urls.add(href)
+            if '-' in href.split('/')[-2]:
+                article_urls[self._intern(href)] = None
             
-            if len(article_urls) >= limit * 2:  # Coletar extras para filtrar depois
+            if len(article_urls) >= limit:
                 break
         
-        # Ordenar e limitar
-        sorted_urls = sorted(article_urls)[:limit]
+        urls = list(article_urls)
         
-        logger.info(f"✓ {len(sorted_urls)} URLs encontradas")
+        logger.info(f"✓ {len(urls)} URLs encontradas")
         
-        return sorted_urls
+        return urls
 
 
 def scrape_moneytimes(
@@ -12,11 +12,12 @@ Características:
 """
 
 from __future__ import annotations
+import re
 from typing import Literal, List, Optional
 from datetime import datetime
 import logging
 
-from ..base_scraper import BaseScraper
+from ..base_scraper import BaseScraper, compile_url_filter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,13 @@ class ValorScraper(BaseScraper):
     MIN_SUCCESS_RATE = 0.3  # 30% - tem paywall
     HAS_PAYWALL = True
     
+    # Páginas de navegação/redes sociais (regex pré-compilada, sem diferenciar caixa)
+    _REJECT_RE = compile_url_filter(
+        r"/autor/|/tag/|/busca/|/search/|utm_|facebook|twitter"
+        r"|linkedin|newsletter|assine",
+        re.IGNORECASE,
+    )
+    
     def __init__(self, scraper):
         """Inicializa o scraper."""
         super().__init__(scraper, source_id="valor")
@@ -64,40 +72,29 @@ class ValorScraper(BaseScraper):
         # Scroll para carregar mais conteúdo
         self.scraper.scroll_and_load(scroll_pause=2.0, max_scrolls=3)
         
-        # Extrair todos os links
-        all_links = self.scraper.driver.find_elements('css selector', 'a')
+        # Filtrar no navegador (domínio, tamanho e navegação): só candidatos cruzam o WebDriver
+        hrefs = self._dom_hrefs(self.scraper.driver, "valor.globo.com")
         
-        article_urls: set[str] = set()
+        # Dict mantém a ordem de descoberta na página (sem ordenar no fim)
+        article_urls: dict[str, None] = {}
         
-        for link in all_links:
-            href = link.get_attribute('href')
-            
-            if not href or 'valor.globo.com' not in href:
-                continue
-            
+        for href in hrefs:
             # URLs de artigos têm data no formato: /ano/mes/dia/
             # Ex: /financas/noticia/2026/01/28/titulo-da-noticia.ghtml
             if '/noticia/' in href and '/20' in href:  # Ano 20xx
                 # Verificar se tem estrutura de data
                 parts = href.split('/')
                 if len(parts) >= 7:  # Mínimo para ter /noticia/ano/mes/dia/titulo
-                    # Excluir páginas de navegação
-                    if not any(x in href.lower() for x in [
-                        '/autor/', '/tag/', '/busca/', '/search/',
-                        'utm_', 'facebook', 'twitter', 'linkedin',
-                        'newsletter', 'assine'
-                    ]):
-                        article_urls.add(href)
+                    article_urls[self._intern(href)] = None
             
-            if len(article_urls) >= limit * 2:
+            if len(article_urls) >= limit:
                 break
         
-        # Ordenar e limitar
-        sorted_urls = sorted(article_urls)[:limit]
+        urls = list(article_urls)
         
-        logger.info(f"✓ {len(sorted_urls)} URLs encontradas")
+        logger.info(f"✓ {len(urls)} URLs encontradas")
         
-        return sorted_urls
+        return urls
     
     def get_financas_articles(self, limit: int = 20) -> list[str]:
         """Atalho para artigos de Finanças."""
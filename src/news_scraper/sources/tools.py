@@ -10,22 +10,53 @@ Inclui:
 - User agent management
 - Rate limiting
 - Retry strategies
+- Espera por rede ociosa (lazy-load)
 - Cache
 - Anti-bot detection evasion
 """
 
 from __future__ import annotations
 
+import os
 import time
+import atexit
+import threading
+import random
+import calendar
 import hashlib
+import functools
 import json
 import re
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Any
 from dataclasses import dataclass
 import logging
 
+import soupsieve
+
+try:
+    from blake3 import blake3
+except ImportError:  # dependência opcional: pip install news-scraper[fast]
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # dependência opcional: pip install news-scraper[fast]
+    orjson = None
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:  # dependência opcional: pip install news-scraper[fast]
+    ahocorasick = None
+
+try:
+    import xxhash
+except ImportError:  # dependência opcional: pip install news-scraper[fast]
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +68,7 @@ class UserAgentRotator:
     """Rotaciona user agents para evitar detecção."""
     
     # User agents realistas e modernos
-    USER_AGENTS = [
+    USER_AGENTS: tuple[str, ...] = (
         # Chrome no Windows
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -58,15 +89,31 @@ class UserAgentRotator:
         
         # Edge no Windows
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-    ]
+    )
+    
+    # Headers fixos de navegador real; só o User-Agent muda por requisição
+    _HEADER_TEMPLATE = {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Cache-Control": "max-age=0",
+    }
     
     def __init__(self):
         self._index = 0
+        # RNG próprio: não disputa o estado global do módulo random
+        self._rng = random.Random()
     
     def get_random(self) -> str:
         """Retorna user agent aleatório."""
-        import random
-        return random.choice(self.USER_AGENTS)
+        return self._rng.choice(self.USER_AGENTS)
     
     def get_next(self) -> str:
         """Retorna próximo user agent (round-robin)."""
@@ -76,20 +123,7 @@ class UserAgentRotator:
     
     def get_browser_headers(self, url: str = None) -> dict[str, str]:
         """Retorna headers completos que simulam navegador real."""
-        return {
-            "User-Agent": self.get_random(),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        }
+        return {"User-Agent": self.get_random(), **self._HEADER_TEMPLATE}
 
 
 # ============================================================================
@@ -117,15 +151,16 @@ class RateLimiter:
         Returns:
             Tempo esperado em segundos
         """
-        now = time.time()
+        now = time.monotonic()
+        last = self._last_request.get(key)
         
-        if key in self._last_request:
-            elapsed = now - self._last_request[key]
+        if last is not None:
+            elapsed = now - last
             if elapsed < self.min_interval:
                 wait_time = self.min_interval - elapsed
                 logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {key}")
                 time.sleep(wait_time)
-                self._last_request[key] = time.time()
+                self._last_request[key] = time.monotonic()
                 return wait_time
         
         self._last_request[key] = now
@@ -151,22 +186,23 @@ class DomainRateLimiter:
     def wait(self, domain: str):
         """Espera o tempo necessário antes de fazer requisição."""
         delay = self._domain_delays.get(domain, self.default_delay)
+        last = self._last_request.get(domain)
         
-        if domain in self._last_request:
-            elapsed = time.time() - self._last_request[domain]
+        if last is not None:
+            elapsed = time.monotonic() - last
             if elapsed < delay:
                 wait_time = delay - elapsed
                 logger.debug(f"Waiting {wait_time:.2f}s for {domain}")
                 time.sleep(wait_time)
         
-        self._last_request[domain] = time.time()
+        self._last_request[domain] = time.monotonic()
 
 
 # ============================================================================
 # RETRY STRATEGIES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuração de retry."""
     max_attempts: int = 3
@@ -181,6 +217,33 @@ class RetryStrategy:
     
     def __init__(self, config: RetryConfig = None):
         self.config = config or RetryConfig()
+        self._rng = random.Random()
+        # Sequência de delays (já limitada por max_delay) calculada uma única vez
+        self._delays = [
+            min(self.config.initial_delay * self.config.exponential_base ** i, self.config.max_delay)
+            for i in range(self.config.max_attempts)
+        ]
+        # Fatores de jitter sorteados uma vez por instância (mantém o descasamento
+        # entre clientes) e consumidos em sequência circular
+        self._jitter = tuple(self._rng.uniform(0.5, 1.5) for _ in range(64))
+        self._jitter_index = 0
+    
+    def get_delay(self, attempt: int) -> float:
+        """
+        Retorna o delay antes da próxima tentativa.
+        
+        Args:
+            attempt: Índice da tentativa que falhou (0 = primeira)
+            
+        Returns:
+            Delay em segundos (com jitter, se configurado)
+        """
+        delay = self._delays[min(attempt, len(self._delays) - 1)]
+        if self.config.jitter:
+            factor = self._jitter[self._jitter_index & 63]
+            self._jitter_index += 1
+            return min(delay * factor, self.config.max_delay)
+        return delay
     
     def execute(self, func, *args, **kwargs):
         """
@@ -189,10 +252,7 @@ class RetryStrategy:
         Raises:
             Exception: Se todas as tentativas falharem
         """
-        import random
-        
         last_exception = None
-        delay = self.config.initial_delay
         
         for attempt in range(1, self.config.max_attempts + 1):
             try:
@@ -204,17 +264,9 @@ class RetryStrategy:
                     logger.error(f"All {self.config.max_attempts} attempts failed")
                     raise
                 
-                # Calcular delay com backoff exponencial
-                if self.config.jitter:
-                    jitter_factor = random.uniform(0.5, 1.5)
-                    actual_delay = min(delay * jitter_factor, self.config.max_delay)
-                else:
-                    actual_delay = min(delay, self.config.max_delay)
-                
+                actual_delay = self.get_delay(attempt - 1)
                 logger.warning(f"Attempt {attempt} failed: {e}. Retrying in {actual_delay:.2f}s...")
                 time.sleep(actual_delay)
-                
-                delay *= self.config.exponential_base
         
         raise last_exception
 
@@ -223,78 +275,342 @@ class RetryStrategy:
 # CACHE
 # ============================================================================
 
+# posix_fadvise só existe em alguns sistemas (Linux, por exemplo)
+_FADV_DONTNEED = getattr(os, "POSIX_FADV_DONTNEED", None) if hasattr(os, "posix_fadvise") else None
+
+
+@functools.lru_cache(maxsize=8192)
+def _hash_key(key: str, algo: str) -> str:
+    """
+    Retorna o hash hexadecimal de uma chave de cache (memoizado).
+    
+    get() seguido de set() para a mesma URL é o padrão comum; com o cache
+    o segundo acesso não recalcula o hash.
+    """
+    if algo == "blake2b":
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    if algo == "xxhash":
+        return xxhash.xxh3_64_intdigest(key).to_bytes(8, "little").hex()
+    if algo == "blake3":
+        return blake3(key.encode("utf-8")).hexdigest(length=16)
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serializa JSON compacto em UTF-8 (orjson quando disponível)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Lê JSON em bytes (orjson quando disponível)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _cached_at_epoch(cached_at: Any) -> float:
+    """Converte cached_at para epoch (entradas antigas gravavam ISO 8601)."""
+    if isinstance(cached_at, str):
+        return datetime.fromisoformat(cached_at).timestamp()
+    return cached_at
+
+
+def _write_atomic(path: Path, raw: bytes, mtime: Optional[float] = None):
+    """
+    Grava o arquivo de forma atômica (temporário + os.replace).
+    
+    Uma interrupção no meio da escrita nunca deixa JSON truncado no lugar
+    da entrada. As páginas gravadas são liberadas do page cache
+    (POSIX_FADV_DONTNEED): as leituras quentes vêm do LRU em memória.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+            f.flush()
+            if _FADV_DONTNEED is not None:
+                os.posix_fadvise(f.fileno(), 0, 0, _FADV_DONTNEED)
+        if mtime is not None:
+            os.utime(tmp_path, (mtime, mtime))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _scan_cache_files(directory):
+    """Itera (os.scandir) os arquivos .json do cache, descendo nos subdiretórios."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_cache_files(entry.path)
+            elif entry.name.endswith(".json"):
+                yield entry
+
+
+# Caches com gravações possivelmente pendentes; referências fracas para não
+# manter vivas instâncias descartadas até o fim do processo
+_OPEN_CACHES: "weakref.WeakSet[SimpleCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches():
+    """Grava na saída do processo as entradas pendentes dos caches ainda vivos."""
+    for cache in list(_OPEN_CACHES):
+        cache.flush()
+
+
 class SimpleCache:
-    """Cache simples em disco para respostas HTTP."""
+    """
+    Cache simples em disco para respostas HTTP.
+    
+    As gravações são agrupadas: set() só enfileira a entrada, que vai para
+    o disco no próximo flush (a cada FLUSH_INTERVAL segundos, em close(),
+    ao sair do bloco with, quando a instância é descartada ou na saída
+    normal do processo). Se o processo morrer antes disso (crash, SIGKILL,
+    os._exit), as gravações dos últimos FLUSH_INTERVAL segundos se perdem
+    sem aviso; use FLUSH_INTERVAL = 0 ou chame flush() quando isso importar.
+    """
     
-    def __init__(self, cache_dir: Path, ttl_hours: int = 24):
+    # Hash do nome dos arquivos: "blake2b" (stdlib), "xxhash" ou "blake3"
+    # (opcionais, mais rápidos) ou "md5" (formato legado, migrado na leitura)
+    HASH_ALGO = "blake2b"
+    
+    # Gravações ficam em memória e vão para o disco em lote a cada FLUSH_INTERVAL
+    # segundos (ver docstring da classe); 0 grava imediatamente
+    FLUSH_INTERVAL = 5.0
+    
+    # Tempo de vida (segundos) das falhas registradas com set_negative
+    NEGATIVE_TTL = 60.0
+    
+    # Entradas recentes mantidas em memória (LRU) na frente do disco; 0 desativa
+    MEMORY_ENTRIES = 512
+    
+    def __init__(self, cache_dir: Path, ttl_hours: int = 24, hash_algo: Optional[str] = None):
         """
         Args:
             cache_dir: Diretório para cache
             ttl_hours: Tempo de vida do cache em horas
+            hash_algo: Algoritmo de hash das chaves (padrão: HASH_ALGO)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
+        self.ttl_seconds = ttl_hours * 3600.0
+        self.hash_algo = hash_algo or self.HASH_ALGO
+        if {"blake3": blake3, "xxhash": xxhash}.get(self.hash_algo, hashlib) is None:
+            logger.warning(f"{self.hash_algo} não instalado, usando blake2b nas chaves do cache")
+            self.hash_algo = "blake2b"
+        
+        self._shards: set[Path] = set()
+        self._pending: dict[Path, tuple[bytes, Optional[float]]] = {}
+        self._pending_lock = threading.Lock()
+        self._memory: OrderedDict[Path, bytes] = OrderedDict()
+        self._last_flush = time.monotonic()
+        _OPEN_CACHES.add(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def __del__(self):
+        # Instância descartada sem close(): não perde as gravações pendentes
+        try:
+            self.flush()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Grava as entradas pendentes e tira o cache do flush de saída do processo."""
+        self.flush()
+        _OPEN_CACHES.discard(self)
     
     def _get_cache_path(self, key: str) -> Path:
-        """Retorna caminho do arquivo de cache."""
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.json"
+        """
+        Retorna caminho do arquivo de cache.
+        
+        As entradas ficam em 256 subdiretórios (dois primeiros caracteres do
+        hash), para nenhum diretório crescer demais.
+        """
+        digest = _hash_key(key, self.hash_algo)
+        return self.cache_dir / digest[:2] / f"{digest}.json"
     
-    def get(self, key: str) -> Optional[Any]:
-        """Retorna valor do cache se válido."""
+    def _ensure_shard(self, shard: Path):
+        """Cria o subdiretório da entrada (uma vez por instância)."""
+        if shard not in self._shards:
+            shard.mkdir(exist_ok=True)
+            self._shards.add(shard)
+    
+    def _legacy_paths(self, key: str):
+        """Caminhos antigos da chave: layout plano e/ou hash md5."""
+        digest = _hash_key(key, self.hash_algo)
+        yield self.cache_dir / f"{digest}.json"
+        if self.hash_algo != "md5":
+            legacy = _hash_key(key, "md5")
+            yield self.cache_dir / legacy[:2] / f"{legacy}.json"
+            yield self.cache_dir / f"{legacy}.json"
+    
+    def _migrate_legacy(self, key: str, cache_path: Path) -> bool:
+        """
+        Move uma entrada antiga (layout plano ou md5) para o caminho atual.
+        
+        A migração é preguiçosa: acontece apenas quando a chave é lida.
+        
+        Returns:
+            True se a entrada legada existia e foi migrada
+        """
+        for legacy_path in self._legacy_paths(key):
+            if legacy_path.exists():
+                self._ensure_shard(cache_path.parent)
+                legacy_path.replace(cache_path)
+                return True
+        return False
+    
+    def _load_entry(self, key: str) -> Optional[dict]:
+        """Lê a entrada da chave (pendente ou em disco); None se ausente ou expirada."""
         cache_path = self._get_cache_path(key)
+        # Entradas ainda não gravadas e as lidas há pouco dispensam o disco
+        pending = self._pending.get(cache_path)
+        raw = pending[0] if pending is not None else self._memory.get(cache_path)
         
-        if not cache_path.exists():
+        if raw is None and not cache_path.exists() and not self._migrate_legacy(key, cache_path):
             return None
         
         try:
-            data = json.loads(cache_path.read_text())
-            cached_at = datetime.fromisoformat(data['cached_at'])
+            if raw is None:
+                raw = cache_path.read_bytes()
+            self._remember(cache_path, raw)
+            data = _load_json(raw)
             
-            # Verificar se expirou
-            if datetime.now() - cached_at > self.ttl:
+            # Verificar se expirou (TTL da entrada ou o padrão do cache)
+            ttl = data.get('ttl', self.ttl_seconds)
+            if time.time() - _cached_at_epoch(data['cached_at']) > ttl:
                 logger.debug(f"Cache expired for {key}")
-                cache_path.unlink()
+                with self._pending_lock:
+                    self._pending.pop(cache_path, None)
+                    self._memory.pop(cache_path, None)
+                cache_path.unlink(missing_ok=True)
                 return None
             
-            logger.debug(f"Cache hit for {key}")
-            return data['value']
+            return data
         except Exception as e:
             logger.debug(f"Cache read error: {e}")
             return None
     
-    def set(self, key: str, value: Any):
-        """Salva valor no cache."""
+    def get(self, key: str) -> Optional[Any]:
+        """Retorna valor do cache se válido (falhas registradas contam como ausência)."""
+        data = self._load_entry(key)
+        if data is None or data.get('negative'):
+            return None
+        logger.debug(f"Cache hit for {key}")
+        return data['value']
+    
+    def is_negative(self, key: str) -> bool:
+        """Indica se há uma falha recente registrada com set_negative."""
+        data = self._load_entry(key)
+        return data is not None and data.get('negative', False)
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Salva valor no cache (gravado em disco no próximo flush).
+        
+        Args:
+            key: Chave (normalmente a URL)
+            value: Valor serializável em JSON
+            ttl: Tempo de vida desta entrada em segundos (padrão: ttl_hours)
+        """
+        self._store(key, {'cached_at': time.time(), 'value': value}, ttl)
+    
+    def set_negative(self, key: str, ttl: Optional[float] = None):
+        """
+        Registra uma falha (ex: erro HTTP) por pouco tempo.
+        
+        Enquanto válida, get() retorna None e is_negative() retorna True,
+        evitando novas tentativas em sequência para a mesma chave.
+        
+        Args:
+            key: Chave (normalmente a URL)
+            ttl: Tempo de vida em segundos (padrão: NEGATIVE_TTL)
+        """
+        data = {'cached_at': time.time(), 'value': None, 'negative': True}
+        self._store(key, data, self.NEGATIVE_TTL if ttl is None else ttl)
+    
+    def _store(self, key: str, data: dict, ttl: Optional[float]):
+        """Serializa a entrada e a enfileira para o próximo flush."""
         cache_path = self._get_cache_path(key)
+        # clear_expired usa mtime + ttl_seconds como expiração: com TTL próprio,
+        # o mtime é ajustado para que essa conta dê a expiração da entrada
+        mtime = None
+        if ttl is not None and ttl != self.ttl_seconds:
+            data['ttl'] = ttl
+            mtime = data['cached_at'] + ttl - self.ttl_seconds
         
         try:
-            data = {
-                'cached_at': datetime.now().isoformat(),
-                'value': value,
-            }
-            cache_path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
-            logger.debug(f"Cached {key}")
+            raw = _dump_json(data)
         except Exception as e:
             logger.debug(f"Cache write error: {e}")
+            return
+        
+        with self._pending_lock:
+            self._pending[cache_path] = (raw, mtime)
+        self._remember(cache_path, raw)
+        logger.debug(f"Cached {key}")
+        
+        if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+    
+    def _remember(self, cache_path: Path, raw: bytes):
+        """
+        Guarda os bytes da entrada no LRU em memória.
+        
+        Guarda o JSON serializado (não o objeto): cada get() devolve uma
+        cópia nova, como na leitura do disco.
+        """
+        if self.MEMORY_ENTRIES <= 0:
+            return
+        with self._pending_lock:
+            self._memory[cache_path] = raw
+            self._memory.move_to_end(cache_path)
+            if len(self._memory) > self.MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+    
+    def flush(self):
+        """Grava no disco as entradas pendentes."""
+        with self._pending_lock:
+            for cache_path, (raw, mtime) in self._pending.items():
+                try:
+                    self._ensure_shard(cache_path.parent)
+                    _write_atomic(cache_path, raw, mtime)
+                except Exception as e:
+                    logger.debug(f"Cache write error: {e}")
+            self._pending.clear()
+            self._last_flush = time.monotonic()
     
     def clear_expired(self):
-        """Remove entradas expiradas do cache."""
+        """
+        Remove entradas expiradas do cache.
+        
+        Usa o mtime do arquivo (gravado em set) como cached_at: a varredura
+        só faz stat, sem abrir nem parsear o JSON das entradas. Percorre os
+        subdiretórios e também entradas antigas no layout plano.
+        """
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
+        cutoff = time.time() - self.ttl_seconds
+        for entry in _scan_cache_files(self.cache_dir):
             try:
-                data = json.loads(cache_file.read_text())
-                cached_at = datetime.fromisoformat(data['cached_at'])
-                
-                if datetime.now() - cached_at > self.ttl:
-                    cache_file.unlink()
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
                     count += 1
-            except Exception:
-                # Arquivo corrompido, remover
-                cache_file.unlink()
-                count += 1
+            except FileNotFoundError:
+                continue
         
         if count > 0:
+            with self._pending_lock:
+                self._memory.clear()
             logger.info(f"Cleared {count} expired cache entries")
 
 
@@ -302,6 +618,17 @@ class SimpleCache:
 # PAYWALL DETECTION
 # ============================================================================
 
+def _build_automaton(words) -> Optional[Any]:
+    """Monta um autômato Aho-Corasick com as palavras em minúsculas (ou None)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word.lower(), word.lower())
+    automaton.make_automaton()
+    return automaton
+
+
 class PaywallDetector:
     """Detecta paywalls e conteúdo bloqueado."""
     
@@ -325,6 +652,23 @@ class PaywallDetector:
         '[data-paywall]', '.article-lock', '.content-gate',
     ]
     
+    # Indicadores já em minúsculas (comparados com o HTML em minúsculas)
+    _INDICATORS_LC = tuple(indicator.lower() for indicator in PAYWALL_INDICATORS)
+    
+    # Todos os indicadores numa única varredura do HTML (montado uma vez)
+    _AUTOMATON = _build_automaton(PAYWALL_INDICATORS)
+    
+    # Nomes de classe/id/atributo dos seletores: se nenhum aparece no HTML,
+    # nenhum seletor pode casar e o parse com BeautifulSoup é dispensado
+    _SELECTOR_TOKENS = tuple(selector.strip(".#[]") for selector in PAYWALL_SELECTORS)
+    
+    # Seletores pré-compilados (soupsieve): o combinado percorre o DOM uma vez e
+    # os individuais só classificam os poucos nós encontrados
+    _COMBINED_MATCHER = soupsieve.compile(", ".join(PAYWALL_SELECTORS))
+    _SELECTOR_MATCHERS = tuple(
+        (selector, soupsieve.compile(selector)) for selector in PAYWALL_SELECTORS
+    )
+    
     def detect(self, html: str, text: str = None) -> dict:
         """
         Detecta presença de paywall.
@@ -336,20 +680,26 @@ class PaywallDetector:
         
         # Verificar texto
         html_lower = html.lower()
-        for indicator in self.PAYWALL_INDICATORS:
-            if indicator.lower() in html_lower:
+        if self._AUTOMATON is not None:
+            found = {word for _, word in self._AUTOMATON.iter(html_lower)}
+        else:
+            found = html_lower
+        for indicator, indicator_lower in zip(self.PAYWALL_INDICATORS, self._INDICATORS_LC):
+            if indicator_lower in found:
                 indicators.append(f"text:{indicator}")
         
-        # Verificar seletores CSS
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            for selector in self.PAYWALL_SELECTORS:
-                if soup.select_one(selector):
-                    indicators.append(f"selector:{selector}")
-        except:
-            pass
+        # Verificar seletores CSS (só quando algum nome aparece no HTML)
+        if any(token in html_lower for token in self._SELECTOR_TOKENS):
+            try:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(html, 'lxml')
+                matches = self._COMBINED_MATCHER.select(soup)
+                
+                for selector, matcher in self._SELECTOR_MATCHERS:
+                    if any(matcher.match(node) for node in matches):
+                        indicators.append(f"selector:{selector}")
+            except:
+                pass
         
         # Verificar tamanho do texto (paywall geralmente tem pouco conteúdo)
         if text and len(text.strip()) < 200:
@@ -368,51 +718,51 @@ class PaywallDetector:
 # TEXT CLEANING
 # ============================================================================
 
+def _collapse_whitespace(match: re.Match) -> str:
+    """Substituição de _WHITESPACE_RE: quebras viram parágrafo, o resto um espaço."""
+    return '\n\n' if match.group()[0] == '\n' else ' '
+
+
 class TextCleaner:
     """Limpeza avançada de texto extraído."""
     
+    # Múltiplas quebras de linha, espaços/tabs repetidos e tabs soltos: uma passada
+    _WHITESPACE_RE = re.compile(r'\n{3,}|[ \t]{2,}|\t')
+    
+    # Padrões comuns de boilerplate; cada um corta do ponto em que aparece até o fim
+    BOILERPLATE_PATTERNS = (
+        r'todos os direitos reservados.*',
+        r'© \d{4}.*',
+        r'copyright.*',
+        r'compartilhe:?\s*(facebook|twitter|whatsapp|linkedin).*',
+        r'siga-nos.*',
+        r'assine nossa newsletter.*',
+        r'receba notícias.*',
+    )
+    _BOILERPLATE_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in BOILERPLATE_PATTERNS),
+        re.IGNORECASE | re.DOTALL,
+    )
+    
     @staticmethod
     def clean(text: str) -> str:
         """Limpa texto removendo artefatos comuns."""
         if not text:
             return ""
         
-        # Remover múltiplas quebras de linha
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # Remover espaços múltiplos
-        text = re.sub(r' {2,}', ' ', text)
-        
-        # Remover tabs
-        text = text.replace('\t', ' ')
+        # Normalizar quebras, espaços e tabs
+        text = TextCleaner._WHITESPACE_RE.sub(_collapse_whitespace, text)
         
-        # Remover espaços no início/fim de cada linha
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-        
-        # Remover linhas muito curtas (geralmente lixo)
-        lines = [line for line in text.split('\n') if len(line.strip()) > 3 or line.strip() == '']
-        text = '\n'.join(lines)
+        # Remover espaços no início/fim de cada linha e linhas muito curtas (geralmente lixo)
+        lines = (line.strip() for line in text.split('\n'))
+        text = '\n'.join(line for line in lines if len(line) > 3 or not line)
         
         return text.strip()
     
     @staticmethod
     def remove_boilerplate(text: str) -> str:
         """Remove textos padrão (copyright, rodapé, etc)."""
-        # Padrões comuns de boilerplate
-        boilerplate_patterns = [
-            r'todos os direitos reservados.*',
-            r'© \d{4}.*',
-            r'copyright.*',
-            r'compartilhe:?\s*(facebook|twitter|whatsapp|linkedin).*',
-            r'siga-nos.*',
-            r'assine nossa newsletter.*',
-            r'receba notícias.*',
-        ]
-        
-        for pattern in boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-        
+        text = TextCleaner._BOILERPLATE_RE.sub('', text)
         return TextCleaner.clean(text)
     
     @staticmethod
@@ -445,6 +795,22 @@ class DateNormalizer:
         'dezembro': 12, 'dez': 12,
     }
     
+    # Começa com YYYY-MM-DD (devolvido sem alteração)
+    _ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+    
+    # Formatos aceitos: %Y-%m-%dT%H:%M:%S[Z], %Y-%m-%d %H:%M:%S, %Y/%m/%d, %d/%m/%Y [%H:%M]
+    _NUMERIC_DATE_RE = re.compile(
+        r'(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})(?:T\d{1,2}:\d{1,2}:\d{1,2}Z?| \d{1,2}:\d{1,2}:\d{1,2})'
+        r'|(?P<y2>\d{4})/(?P<m2>\d{1,2})/(?P<d2>\d{1,2})'
+        r'|(?P<d3>\d{1,2})/(?P<m3>\d{1,2})/(?P<y3>\d{4})(?: \d{1,2}:\d{1,2})?'
+    )
+    
+    # Mês por extenso restrito aos nomes conhecidos (os mais longos primeiro)
+    _PT_DATE_RE = re.compile(
+        r'(\d{1,2})\s+de\s+(%s)\s+de\s+(\d{4})' % '|'.join(sorted(MONTH_MAP_PT, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    
     @classmethod
     def normalize(cls, date_str: str) -> Optional[str]:
         """
@@ -457,38 +823,31 @@ class DateNormalizer:
         
         date_str = date_str.strip()
         
+        # Triagem pelo formato: cada regex só roda quando a entrada tem a forma dela
+        head = date_str[:10]
+        
         # Já está em formato ISO
-        if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
+        if head[4:5] == '-' and head[7:8] == '-' and cls._ISO_DATE_RE.match(date_str):
             return date_str
         
-        # Tentar diversos formatos
-        formats = [
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y',
-            '%d/%m/%Y %H:%M',
-            '%Y/%m/%d',
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
+        # Demais formatos numéricos: identifica o formato e monta a data direto dos grupos
+        numeric = head[:1].isdigit() and ('/' in head or '-' in head)
+        match = numeric and cls._NUMERIC_DATE_RE.fullmatch(date_str)
+        if match:
+            year = int(match['y'] or match['y2'] or match['y3'])
+            month = int(match['m'] or match['m2'] or match['m3'])
+            day = int(match['d'] or match['d2'] or match['d3'])
+            if 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return f"{year:04d}-{month:02d}-{day:02d}"
         
         # Tentar formato com mês por extenso em português
         # Ex: "28 de janeiro de 2026"
-        match = re.search(r'(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})', date_str, re.IGNORECASE)
+        match = ' de ' in date_str.lower() and cls._PT_DATE_RE.search(date_str)
         if match:
             day = int(match.group(1))
-            month_name = match.group(2).lower()
+            month = cls.MONTH_MAP_PT[match.group(2).lower()]
             year = int(match.group(3))
-            
-            month = cls.MONTH_MAP_PT.get(month_name)
-            if month:
-                return f"{year:04d}-{month:02d}-{day:02d}"
+            return f"{year:04d}-{month:02d}-{day:02d}"
         
         logger.debug(f"Could not normalize date: {date_str}")
         return None
@@ -501,6 +860,9 @@ class DateNormalizer:
 class ContentValidator:
     """Valida qualidade e integridade do conteúdo extraído."""
     
+    # Casa no máximo uma vez por linha: do início da linha até o primeiro link
+    _LINK_LINE_RE = re.compile(r'^.*?(?:http|www\.)', re.MULTILINE)
+    
     @staticmethod
     def validate_title(title: str) -> bool:
         """Valida se título é válido."""
@@ -523,9 +885,16 @@ class ContentValidator:
         if not text or len(text.strip()) < min_length:
             return False
         
-        # Verificar se tem parágrafos
-        paragraphs = [p for p in text.split('\n\n') if len(p.strip()) > 50]
-        if len(paragraphs) < 2:
+        # Verificar se tem parágrafos: trechos de text.split('\n\n'), lidos
+        # com str.find até achar dois (sem montar a lista inteira)
+        paragraphs = 0
+        start = 0
+        while paragraphs < 2 and start >= 0:
+            end = text.find('\n\n', start)
+            if len(text[start:end if end >= 0 else None].strip()) > 50:
+                paragraphs += 1
+            start = end + 2 if end >= 0 else -1
+        if paragraphs < 2:
             return False
         
         # Verificar densidade de palavras (não deve ser só código/lixo)
@@ -547,12 +916,9 @@ class ContentValidator:
             return False
         
         # Não deve ser lista de links
-        lines = text.split('\n')
-        link_lines = sum(1 for line in lines if 'http' in line or 'www.' in line)
-        if len(lines) > 0 and link_lines / len(lines) > 0.5:
-            return False
-        
-        return True
+        lines = text.count('\n') + 1
+        link_lines = sum(1 for _ in ContentValidator._LINK_LINE_RE.finditer(text))
+        return link_lines / lines <= 0.5
 
 
 # ============================================================================
@@ -587,6 +953,90 @@ class LanguageDetector:
         return lang == 'pt' if lang else False
 
 
+# ============================================================================
+# PAGE LOADING
+# ============================================================================
+
+# Milissegundos desde a última resposta concluída (Resource Timing API).
+# O buffer padrão guarda só 250 entradas; ampliado para não "congelar" a contagem.
+_NETWORK_IDLE_JS = (
+    "performance.setResourceTimingBufferSize(5000);"
+    "let last = 0;"
+    "for (const e of performance.getEntriesByType('resource')) {"
+    "  if (e.responseEnd > last) last = e.responseEnd;"
+    "}"
+    "return performance.now() - last;"
+)
+
+
+def wait_for_network_idle(driver, idle_ms: int = 500, timeout: float = 5.0) -> bool:
+    """
+    Espera até a página ficar sem respostas de rede novas por ``idle_ms``.
+    
+    Considera apenas requisições concluídas (Resource Timing): logo após um
+    scroll, as requisições do lazy-load ainda não começaram ou não
+    terminaram e a rede já parece ociosa. Serve para esperar o fim de uma
+    rajada que já começou (ver wait_for_page_growth), não o seu início.
+    
+    Args:
+        driver: WebDriver Selenium
+        idle_ms: Janela sem respostas novas para considerar a rede ociosa
+        timeout: Tempo máximo de espera em segundos
+        
+    Returns:
+        True se a rede ficou ociosa, False se o timeout estourou
+    """
+    deadline = time.monotonic() + timeout
+    poll = idle_ms / 1000 / 4
+    
+    while True:
+        idle_for = driver.execute_script(_NETWORK_IDLE_JS)
+        if idle_for >= idle_ms:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        # Não há como ficar ocioso antes de (idle_ms - idle_for); dorme no mínimo `poll`
+        time.sleep(min(max((idle_ms - idle_for) / 1000, poll), remaining))
+
+
+_SCROLL_HEIGHT_JS = "return document.body.scrollHeight;"
+
+
+def wait_for_page_growth(
+    driver,
+    previous_height: int,
+    timeout: float = 3.0,
+    poll: float = 0.1,
+) -> Optional[int]:
+    """
+    Espera a página crescer além de ``previous_height`` (conteúdo lazy-load novo).
+    
+    Após um scroll, document.readyState continua "complete" e a rede pode
+    parecer ociosa antes de o feed disparar as requisições; o sinal
+    confiável de conteúdo novo é o aumento de document.body.scrollHeight.
+    
+    Args:
+        driver: WebDriver Selenium
+        previous_height: scrollHeight antes do scroll
+        timeout: Tempo máximo de espera em segundos
+        poll: Intervalo entre leituras em segundos
+        
+    Returns:
+        Nova altura, ou None se a página não cresceu dentro do timeout
+    """
+    deadline = time.monotonic() + timeout
+    
+    while True:
+        height = driver.execute_script(_SCROLL_HEIGHT_JS)
+        if height > previous_height:
+            return height
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(poll, remaining))
+
+
 # ============================================================================
 # ANTI-BOT EVASION
 # ============================================================================
@@ -594,6 +1044,10 @@ class LanguageDetector:
 class AntiBotEvasion:
     """Técnicas para evitar detecção de bot."""
     
+    # Rotator compartilhado: get_realistic_headers não cria um (com RNG próprio)
+    # a cada requisição
+    _UA_ROTATOR = UserAgentRotator()
+    
     @staticmethod
     def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
         """Espera tempo aleatório."""
@@ -604,8 +1058,7 @@ class AntiBotEvasion:
     @staticmethod
     def get_realistic_headers(referer: str = None) -> dict[str, str]:
         """Retorna headers realistas."""
-        ua_rotator = UserAgentRotator()
-        headers = ua_rotator.get_browser_headers()
+        headers = AntiBotEvasion._UA_ROTATOR.get_browser_headers()
         
         if referer:
             headers['Referer'] = referer
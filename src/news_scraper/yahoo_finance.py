@@ -12,6 +12,25 @@ class YahooFinanceScraper:
 
     BASE_URL = "https://br.finance.yahoo.com"
 
+    # Múltiplos padrões de URL do Yahoo Finance
+    NEWS_PATTERNS = (
+        "/noticias/",
+        "/news/",
+        "finance.yahoo.com/noticias",
+        "finance.yahoo.com/news",
+    )
+
+    # URLs de navegação
+    SKIP_PATTERNS = ("?", "#", "/video", "/galeria", "/search")
+
+    # a.href já vem absoluto (resolvido pelo navegador)
+    _NEWS_HREFS_JS = """
+        const [patterns, skips] = arguments;
+        return Array.from(document.querySelectorAll('a[href]'), a => a.href).filter(
+            h => patterns.some(p => h.includes(p)) && !skips.some(s => h.includes(s))
+        );
+    """
+
     def __init__(self, scraper: ProfessionalScraper):
         self.scraper = scraper
 
@@ -22,40 +41,22 @@ class YahooFinanceScraper:
         news_page = f"{self.BASE_URL}/noticias/"
 
         # Carrega e espera renderizar
-        html = self.scraper.get_page(news_page, wait_time=5)
+        self.scraper.get_page(news_page, wait_time=5)
 
         # Scroll para carregar mais
-        html = self.scraper.scroll_and_load(scroll_pause=3.0, max_scrolls=5)
+        self.scraper.scroll_and_load(scroll_pause=3.0, max_scrolls=5)
 
-        soup = BeautifulSoup(html, "lxml")
+        # Filtra os links no próprio navegador: só os de notícia cruzam o WebDriver
+        hrefs = self.scraper.driver.execute_script(
+            self._NEWS_HREFS_JS, self.NEWS_PATTERNS, self.SKIP_PATTERNS
+        ) or []
 
-        # Yahoo Finance: encontra todos os links
         urls: set[str] = set()
 
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-
-            # Múltiplos padrões de URL do Yahoo Finance
-            if any(
-                pattern in href
-                for pattern in [
-                    "/noticias/",
-                    "/news/",
-                    "finance.yahoo.com/noticias",
-                    "finance.yahoo.com/news",
-                ]
-            ):
-                # Evita URLs de navegação
-                if any(skip in href for skip in ["?", "#", "/video", "/galeria", "/search"]):
-                    continue
-
-                full_url = urljoin(self.BASE_URL, href)
-                
-                # Garante que é URL completa e válida
-                if full_url.startswith("http") and "finance.yahoo.com" in full_url:
-                    # Remove query params e fragments
-                    full_url = full_url.split("?")[0].split("#")[0]
-                    urls.add(full_url)
+        for href in hrefs:
+            # Garante que é URL completa e válida
+            if href.startswith("http") and "finance.yahoo.com" in href:
+                urls.add(href)
 
                 if len(urls) >= limit:
                     break
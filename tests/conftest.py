@@ -0,0 +1,216 @@
+"""
+Configuração compartilhada do pytest.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from news_scraper import scrape
+from news_scraper.browser import ARTICLE_READY_SELECTOR, BrowserConfig, ProfessionalScraper
+from news_scraper.extract import extract_article_metadata
+from news_scraper.polite import PoliteSession
+
+# Conexões mantidas abertas por host na sessão HTTP compartilhada dos testes
+HTTP_POOL_SIZE = 32
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-cli-cache",
+        action="store_true",
+        default=False,
+        help="Executa sempre o --help do CLI em subprocesso, ignorando o cache em disco (test_cli_coverage.py)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Sob pytest-xdist, usa --dist=loadgroup quando -n é passado sem --dist.
+    
+    O modo padrão (load) ignora xdist_group e espalharia os testes do grupo
+    "browser" entre os workers, cada um iniciando seu próprio Chrome.
+    """
+    if getattr(config.option, "dist", "no") != "load":
+        return
+    if any(arg.startswith("--dist") for arg in config.invocation_params.args):
+        return
+    config.option.dist = "loadgroup"
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Pula os testes marcados com slow ou benchmark, salvo quando pedidos com -m.
+    
+    Os lentos (slow) acessam os sites de verdade por minutos; rodam com
+    -m slow (CI). As medições repetem cada coleta várias vezes; rodam com
+    -m benchmark e também são puladas se o pytest-benchmark não estiver
+    instalado.
+    """
+    markexpr = config.option.markexpr or ""
+    
+    skip_slow = None
+    if "slow" not in markexpr:
+        skip_slow = pytest.mark.skip(reason="teste lento (rede real): rode com -m slow")
+    
+    skip_benchmark = None
+    if "benchmark" not in markexpr:
+        skip_benchmark = pytest.mark.skip(reason="medição de performance: rode com -m benchmark")
+    elif not config.pluginmanager.hasplugin("benchmark"):
+        skip_benchmark = pytest.mark.skip(
+            reason="pytest-benchmark não instalado (pip install news-scraper[dev])"
+        )
+    
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            if skip_benchmark:
+                item.add_marker(skip_benchmark)
+        elif skip_slow and item.get_closest_marker("slow"):
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_session():
+    """
+    requests.Session única (keep-alive) para os downloads HTTP da sessão de testes.
+    
+    scrape_urls (scrape, collect sem --skip-scrape rodando no próprio
+    processo) passa a usá-la em vez de abrir uma Session nova por chamada:
+    conexões TCP/TLS e a resolução de DNS de cada host são feitas uma vez.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(scrape, "PoliteSession", functools.partial(PoliteSession, session=session))
+        yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def shared_browser():
+    """
+    Navegador único para a sessão (test_all_scrapers.py e test_base_scraper_features.py).
+    
+    Sob pytest-xdist, os testes que o usam ficam no grupo "browser"
+    (--dist=loadgroup), para que um só worker pague a inicialização do Chrome.
+    """
+    config = BrowserConfig(headless=True)
+    scraper = ProfessionalScraper(config)
+    scraper.start()
+    yield scraper
+    scraper.stop()
+
+
+@pytest.fixture(scope="session")
+def cached_extract():
+    """
+    Carrega e extrai cada artigo uma única vez por URL na sessão.
+    
+    Os testes de metadados (por site e em test_all_scrapers.py) costumam
+    repetir as mesmas URLs recentes; só a primeira chamada navega e extrai.
+    Falhas não são memorizadas.
+    
+    Returns:
+        Função extract(url, browser) -> ArticleMetadata
+    """
+    cache = {}
+    
+    def extract(url: str, browser):
+        article = cache.get(url)
+        if article is None:
+            browser.get_page(url, wait_selector=ARTICLE_READY_SELECTOR)
+            article = cache[url] = extract_article_metadata(url, browser.driver)
+        return article
+    
+    return extract
+
+
+def _user_properties(terminalreporter, name: str):
+    """Valores registrados com record_property(name, ...) nos testes executados."""
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            for key, value in getattr(report, "user_properties", ()):
+                if key == name:
+                    yield value
+
+
+def _write_sources(terminalreporter):
+    """Comparativo de fontes suportadas (test_compare_all_sources)."""
+    for sources in _user_properties(terminalreporter, "sources"):
+        terminalreporter.write_sep("=", "📋 COMPARATIVO DE SCRAPERS")
+        terminalreporter.write_line(f"{'Fonte':<25} {'Domínio':<30} {'Status'}")
+        for source_name, domain in sources:
+            terminalreporter.write_line(f"{source_name:<25} {domain:<30} ✓")
+        terminalreporter.write_line(f"Total: {len(sources)} fontes suportadas")
+
+
+def _write_source_rows(terminalreporter):
+    """URLs coletadas e amostra de metadados por fonte (test_all_scrapers.py)."""
+    urls = sorted(_user_properties(terminalreporter, "urls"))
+    if urls:
+        terminalreporter.write_sep("=", "🔗 URLS COLETADAS")
+        for source_name, count in urls:
+            terminalreporter.write_line(f"✓ {source_name:20} {count} URLs")
+    
+    samples = sorted(_user_properties(terminalreporter, "metadata"))
+    if samples:
+        terminalreporter.write_sep("=", "📰 METADADOS EXTRAÍDOS")
+        for source_name, title, date, author, text_length in samples:
+            terminalreporter.write_line(f"✓ {source_name}: {title}...")
+            terminalreporter.write_line(f"  Data: {date} | Autor: {author} | Texto: {text_length} chars")
+
+
+def _write_rates(terminalreporter):
+    """Relatórios de qualidade e datas por fonte (test_all_scrapers.py)."""
+    tables = [
+        ("quality", "📊 RELATÓRIO DE QUALIDADE", ""),
+        ("dates", "📅 RELATÓRIO DE EXTRAÇÃO DE DATAS", " válidas"),
+    ]
+    for name, title, suffix in tables:
+        rows = sorted(_user_properties(terminalreporter, name))
+        if not rows:
+            continue
+        terminalreporter.write_sep("=", title)
+        for source_name, rate, success, total in rows:
+            status = "✅" if rate >= 0.8 else "⚠️"
+            terminalreporter.write_line(f"{status} {source_name:20} {rate:>6.1%} ({success}/{total}{suffix})")
+
+
+def _write_cli_coverage(terminalreporter):
+    """Cobertura dos comandos e parâmetros do CLI (test_cli_coverage.py)."""
+    for commands, sections in _user_properties(terminalreporter, "cli_coverage"):
+        terminalreporter.write_sep("=", "RELATÓRIO DE COBERTURA - CLI")
+        terminalreporter.write_line("✓ Comandos principais:")
+        for cmd, success in commands:
+            terminalreporter.write_line(f"  {'✓' if success else '✗'} {cmd}")
+        
+        found = total = 0
+        for title, tokens in sections:
+            terminalreporter.write_line(f"✓ {title}:")
+            for token, present in tokens:
+                terminalreporter.write_line(f"  {'✓' if present else '✗'} {token}")
+            found += sum(1 for _, present in tokens if present)
+            total += len(tokens)
+        if total:
+            terminalreporter.write_line(f"Cobertura: {found / total:.0%} dos parâmetros documentados")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Relatórios dos testes informativos, montados uma única vez ao final.
+    
+    Os testes registram seus dados com record_property em vez de print: a
+    saída não disputa o stdout capturado e é agregada também sob pytest-xdist.
+    """
+    _write_sources(terminalreporter)
+    _write_source_rows(terminalreporter)
+    _write_rates(terminalreporter)
+    _write_cli_coverage(terminalreporter)
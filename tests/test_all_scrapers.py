@@ -8,16 +8,25 @@ Valida que todos os scrapers:
 4. Extraem datas válidas
 """
 
+import logging
+import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from news_scraper.browser import BrowserConfig, ProfessionalScraper
+from dataclasses import dataclass
+from news_scraper.browser import BrowserConfig, BrowserPool
 from news_scraper.sources.pt import InfoMoneyScraper, ValorScraper, EInvestidorScraper, MoneyTimesScraper
 from news_scraper.sources.en import BloombergScraper
-from news_scraper.extract import extract_article_metadata
+
+
+# Testes que usam o navegador compartilhado ficam no mesmo worker (pytest -n auto --dist=loadgroup)
+pytestmark = pytest.mark.xdist_group("browser")
+
+logger = logging.getLogger(__name__)
 
 
 # Configuração de todos os scrapers
-SCRAPERS = [
+ALL_SCRAPERS = [
     ("InfoMoney", InfoMoneyScraper, "infomoney.com.br"),
     ("Valor Econômico", ValorScraper, "valor.globo.com"),
     ("Bloomberg Brasil", BloombergScraper, "bloomberg.com.br"),
@@ -26,20 +35,99 @@ SCRAPERS = [
 ]
 
 
-@pytest.fixture(scope="module")
-def scraper():
-    """Fixture com scraper configurado."""
+def _source_id(domain: str) -> str:
+    """Identificador curto da fonte (primeiro rótulo do domínio, ex.: "infomoney")."""
+    return domain.split(".")[0]
+
+
+def select_sources(sources, requested: str):
+    """
+    Filtra as fontes pela variável NS_TEST_SOURCES.
+    
+    Args:
+        sources: Lista de (nome, classe, domínio)
+        requested: Ids separados por vírgula (ex.: "infomoney,valor");
+            vazio ou "all" mantém todas
+    
+    Returns:
+        Fontes selecionadas, na ordem original
+    
+    Raises:
+        ValueError: Se algum id não corresponder a uma fonte
+    """
+    wanted = {token.strip().lower() for token in requested.split(",") if token.strip()}
+    if not wanted or "all" in wanted:
+        return list(sources)
+    
+    known = {_source_id(domain) for _, _, domain in sources}
+    unknown = wanted - known
+    if unknown:
+        raise ValueError(f"NS_TEST_SOURCES: fontes desconhecidas {sorted(unknown)} (disponíveis: {sorted(known)})")
+    return [source for source in sources if _source_id(source[2]) in wanted]
+
+
+# NS_TEST_SOURCES=infomoney pytest tests/test_all_scrapers.py -q  → só uma fonte ao vivo
+SCRAPERS = select_sources(ALL_SCRAPERS, os.environ.get("NS_TEST_SOURCES", ""))
+SCRAPER_IDS = [_source_id(domain) for _, _, domain in SCRAPERS]
+
+
+def _collect_source_urls(pool, scraper_class):
+    """Coleta até 3 URLs recentes de uma fonte com um navegador do pool."""
+    with pool.browser() as browser:
+        return scraper_class(browser).get_latest_articles(limit=3)
+
+
+def _probe_article(pool, url, extract):
+    """
+    Carrega e extrai um artigo com qualquer navegador livre do pool (via cached_extract).
+    
+    Falhas de carga/extração ficam como None (contam como insucesso nas taxas).
+    """
+    with pool.browser() as browser:
+        try:
+            return extract(url, browser)
+        except Exception as e:
+            logger.warning(f"Erro em {url}: {e}")
+            return None
+
+
+@pytest.fixture(scope="session")
+def collected_articles(cached_extract):
+    """
+    Artigos de todas as fontes, coletados uma única vez por sessão.
+    
+    As listagens rodam em paralelo, uma por navegador do BrowserPool; assim
+    que uma termina, cada artigo dela vira uma tarefa própria, atendida pelo
+    primeiro navegador livre. Fontes lentas não seguram as demais e o pool
+    não passa de um navegador por fonte. Os testes de metadados, qualidade
+    e datas validam o mesmo material.
+    
+    Returns:
+        Dict {nome da fonte: [ArticleMetadata | None, ...]} na ordem de SCRAPERS
+    """
     config = BrowserConfig(headless=True)
-    scraper = ProfessionalScraper(config)
-    scraper.start()
-    yield scraper
-    scraper.stop()
+    with BrowserPool(config, min_size=0, max_size=len(SCRAPERS)) as pool:
+        with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+            listings = {
+                executor.submit(_collect_source_urls, pool, scraper_class): source_name
+                for source_name, scraper_class, domain in SCRAPERS
+            }
+            articles = {}
+            for listing in as_completed(listings):
+                articles[listings[listing]] = [
+                    executor.submit(_probe_article, pool, url, cached_extract)
+                    for url in listing.result()
+                ]
+        return {
+            source_name: [future.result() for future in articles[source_name]]
+            for source_name, scraper_class, domain in SCRAPERS
+        }
 
 
-@pytest.mark.parametrize("source_name,scraper_class,domain", SCRAPERS)
-def test_all_sources_collect_urls(scraper, source_name, scraper_class, domain):
-    """Testa que cada fonte consegue coletar URLs."""
-    source_scraper = scraper_class(scraper)
+@pytest.mark.parametrize("source_name,scraper_class,domain", SCRAPERS, ids=SCRAPER_IDS)
+def test_all_sources_collect_urls(shared_browser, record_property, source_name, scraper_class, domain):
+    """Testa que cada fonte consegue coletar URLs (contagem no resumo do pytest)."""
+    source_scraper = scraper_class(shared_browser)
     urls = source_scraper.get_latest_articles(limit=3)
     
     assert len(urls) > 0, f"{source_name}: Deve retornar pelo menos 1 URL"
@@ -49,20 +137,19 @@ def test_all_sources_collect_urls(scraper, source_name, scraper_class, domain):
         assert domain in url, f"{source_name}: URL deve conter domínio {domain}"
         assert url.startswith("http"), f"{source_name}: URL deve ser válida"
     
-    print(f"\n✓ {source_name}: {len(urls)} URLs coletadas")
+    record_property("urls", (source_name, len(urls)))
 
 
-@pytest.mark.parametrize("source_name,scraper_class,domain", SCRAPERS)
-def test_all_sources_extract_metadata(scraper, source_name, scraper_class, domain):
-    """Testa que cada fonte extrai metadados corretamente."""
-    source_scraper = scraper_class(scraper)
-    urls = source_scraper.get_latest_articles(limit=1)
+@pytest.mark.parametrize("source_name,scraper_class,domain", SCRAPERS, ids=SCRAPER_IDS)
+def test_all_sources_extract_metadata(collected_articles, record_property, source_name, scraper_class, domain):
+    """Testa que cada fonte extrai metadados corretamente (amostra no resumo do pytest)."""
+    articles = collected_articles[source_name]
     
-    assert len(urls) > 0, f"{source_name}: Deve ter URLs para testar"
+    assert len(articles) > 0, f"{source_name}: Deve ter URLs para testar"
     
-    url = urls[0]
-    scraper.get_page(url, wait_time=3)
-    article = extract_article_metadata(url, scraper.driver)
+    article = articles[0]
+    if article is None:
+        pytest.fail(f"{source_name}: Falha ao carregar/extrair o primeiro artigo")
     
     # Validações essenciais
     errors = []
@@ -93,124 +180,91 @@ def test_all_sources_extract_metadata(scraper, source_name, scraper_class, domai
     if errors:
         pytest.fail(f"{source_name}: {', '.join(errors)}")
     
-    print(f"\n✓ {source_name}: Metadados extraídos com sucesso")
-    print(f"  Título: {article.title[:50]}...")
-    print(f"  Data: {article.date_published}")
-    print(f"  Autor: {article.author or 'N/A'}")
-    print(f"  Texto: {len(article.text)} chars")
-
-
-def test_all_sources_quality_threshold(scraper):
-    """Testa que todas as fontes mantêm qualidade mínima de 80%."""
-    results = []
-    
-    for source_name, scraper_class, domain in SCRAPERS:
-        source_scraper = scraper_class(scraper)
-        urls = source_scraper.get_latest_articles(limit=3)
-        
-        if not urls:
-            continue
-        
-        success_count = 0
-        
-        for url in urls:
-            try:
-                scraper.get_page(url, wait_time=2)
-                article = extract_article_metadata(url, scraper.driver)
-                
-                # Verificar se campos essenciais existem
-                has_title = article.title and len(article.title) > 10
-                has_date = article.date_published and isinstance(article.date_published, datetime)
-                has_text = article.text and len(article.text) > 100
-                
-                if has_title and has_date and has_text:
-                    success_count += 1
-            except Exception as e:
-                print(f"Erro em {url}: {e}")
-                continue
-        
-        success_rate = success_count / len(urls) if urls else 0
-        results.append((source_name, success_rate, success_count, len(urls)))
-    
-    print("\n" + "=" * 70)
-    print("📊 RELATÓRIO DE QUALIDADE")
-    print("=" * 70)
-    
-    for source_name, rate, success, total in results:
-        status = "✅" if rate >= 0.8 else "⚠️"
-        print(f"{status} {source_name:20} {rate:>6.1%} ({success}/{total})")
-    
-    # Falhar se alguma fonte estiver abaixo do threshold
-    failures = [name for name, rate, _, _ in results if rate < 0.8]
-    
-    if failures:
-        pytest.fail(
-            f"Fontes abaixo do threshold de 80%: {', '.join(failures)}"
-        )
-
-
-def test_all_sources_date_extraction(scraper):
-    """Testa especificamente a extração de datas de todas as fontes."""
-    date_results = []
-    
-    for source_name, scraper_class, domain in SCRAPERS:
-        source_scraper = scraper_class(scraper)
-        urls = source_scraper.get_latest_articles(limit=2)
-        
-        if not urls:
-            continue
-        
-        dates_extracted = 0
-        valid_dates = 0
-        
-        for url in urls:
-            try:
-                scraper.get_page(url, wait_time=2)
-                article = extract_article_metadata(url, scraper.driver)
-                
-                if article.date_published:
-                    dates_extracted += 1
-                    
-                    if (isinstance(article.date_published, datetime) and
-                        2020 <= article.date_published.year <= 2030):
-                        valid_dates += 1
-            except Exception as e:
-                print(f"Erro em {url}: {e}")
-                continue
-        
-        date_results.append((source_name, valid_dates, dates_extracted, len(urls)))
-    
-    print("\n" + "=" * 70)
-    print("📅 RELATÓRIO DE EXTRAÇÃO DE DATAS")
-    print("=" * 70)
-    
-    for source_name, valid, extracted, total in date_results:
-        rate = valid / total if total > 0 else 0
-        status = "✅" if rate >= 0.8 else "⚠️"
-        print(f"{status} {source_name:20} {rate:>6.1%} ({valid}/{total} válidas)")
-    
-    # Falhar se alguma fonte não extrair datas adequadamente
-    failures = [
-        name for name, valid, extracted, total in date_results
-        if (valid / total if total > 0 else 0) < 0.8
-    ]
-    
-    if failures:
-        pytest.fail(
-            f"Fontes com problemas na extração de datas: {', '.join(failures)}"
-        )
-
-
-def test_compare_all_sources():
-    """Teste comparativo de todas as fontes (apenas informativo)."""
-    print("\n" + "=" * 70)
-    print("📋 COMPARATIVO DE SCRAPERS")
-    print("=" * 70)
-    print(f"{'Fonte':<25} {'Domínio':<30} {'Status'}")
-    print("-" * 70)
-    
-    for source_name, scraper_class, domain in SCRAPERS:
-        print(f"{source_name:<25} {domain:<30} ✓")
-    
-    print("=" * 70)
-    print(f"Total: {len(SCRAPERS)} fontes suportadas")
+    # Só tipos simples: o pytest-xdist serializa user_properties entre processos
+    record_property("metadata", (
+        source_name,
+        article.title[:50],
+        article.date_published.isoformat(),
+        article.author or "N/A",
+        len(article.text),
+    ))
+
+
+def _is_complete(article) -> bool:
+    """Verifica se campos essenciais existem (título, data e texto)."""
+    if article is None:
+        return False
+    has_title = article.title and len(article.title) > 10
+    has_date = article.date_published and isinstance(article.date_published, datetime)
+    has_text = article.text and len(article.text) > 100
+    return bool(has_title and has_date and has_text)
+
+
+def _has_valid_date(article) -> bool:
+    """Verifica se a data foi extraída e é plausível."""
+    return (
+        article is not None
+        and isinstance(article.date_published, datetime)
+        and 2020 <= article.date_published.year <= 2030
+    )
+
+
+@dataclass
+class SourceHealth:
+    """Taxas de qualidade e de datas de uma fonte, sobre os mesmos artigos."""
+    success_rate: float
+    date_rate: float
+    complete: int
+    valid_dates: int
+    total: int
+
+
+def _source_health(articles) -> SourceHealth:
+    """Calcula qualidade e datas numa única passada pelos artigos da fonte."""
+    complete = valid_dates = 0
+    for article in articles:
+        complete += _is_complete(article)
+        valid_dates += _has_valid_date(article)
+    total = len(articles)
+    return SourceHealth(complete / total, valid_dates / total, complete, valid_dates, total)
+
+
+@pytest.mark.parametrize("source_name,scraper_class,domain", SCRAPERS, ids=SCRAPER_IDS)
+def test_source_health(collected_articles, record_property, source_name, scraper_class, domain):
+    """
+    Testa qualidade mínima (80%) e extração de datas (80%) da fonte.
+    
+    As duas taxas saem dos mesmos carregamentos; cada uma vai para sua
+    tabela no resumo do pytest.
+    """
+    articles = collected_articles[source_name]
+    if not articles:
+        pytest.skip(f"{source_name}: nenhuma URL coletada")
+    
+    health = _source_health(articles)
+    record_property("quality", (source_name, health.success_rate, health.complete, health.total))
+    record_property("dates", (source_name, health.date_rate, health.valid_dates, health.total))
+    
+    problems = []
+    if health.success_rate < 0.8:
+        problems.append(f"{health.success_rate:.1%} abaixo do threshold de 80%")
+    if health.date_rate < 0.8:
+        problems.append(f"problemas na extração de datas ({health.valid_dates}/{health.total})")
+    assert not problems, f"{source_name}: {'; '.join(problems)}"
+
+
+def test_compare_all_sources(record_property):
+    """Teste comparativo de todas as fontes (apenas informativo, no resumo do pytest)."""
+    record_property("sources", [(source_name, domain) for source_name, scraper_class, domain in ALL_SCRAPERS])
+
+
+def test_select_sources_filters_by_domain_id():
+    """NS_TEST_SOURCES aceita ids curtos, "all" ou vazio."""
+    assert select_sources(ALL_SCRAPERS, "") == ALL_SCRAPERS
+    assert select_sources(ALL_SCRAPERS, "all") == ALL_SCRAPERS
+    
+    selected = select_sources(ALL_SCRAPERS, "MoneyTimes, infomoney")
+    assert [name for name, _, _ in selected] == ["InfoMoney", "Money Times"]
+    
+    with pytest.raises(ValueError, match="reuters"):
+        select_sources(ALL_SCRAPERS, "reuters")
@@ -9,7 +9,6 @@ import pytest
 from datetime import datetime
 from news_scraper.sources.en import BloombergScraper
 from news_scraper.browser import BrowserConfig, ProfessionalScraper
-from news_scraper.extract import extract_article_metadata
 
 
 @pytest.fixture(scope="module")
@@ -50,7 +49,7 @@ def test_bloomberg_mercados_category(bloomberg_scraper):
         assert "/mercados/" in url or "bloomberg.com.br" in url
 
 
-def test_bloomberg_extract_metadata(bloomberg_scraper):
+def test_bloomberg_extract_metadata(bloomberg_scraper, cached_extract):
     """Testa extração de metadados completos de um artigo."""
     # Coletar uma URL recente
     urls = bloomberg_scraper.get_latest_articles(limit=1)
@@ -58,11 +57,8 @@ def test_bloomberg_extract_metadata(bloomberg_scraper):
     
     url = urls[0]
     
-    # Acessar a página do artigo
-    bloomberg_scraper.scraper.get_page(url, wait_time=3)
-    
-    # Extrair metadados
-    article = extract_article_metadata(url, bloomberg_scraper.scraper.driver)
+    # Acessar a página do artigo e extrair metadados (uma vez por URL na sessão)
+    article = cached_extract(url, bloomberg_scraper.scraper)
     
     # Validar campos essenciais
     assert article.url == url
@@ -94,7 +90,7 @@ def test_bloomberg_extract_metadata(bloomberg_scraper):
     print(f"  Source: {article.source}")
 
 
-def test_bloomberg_multiple_articles_metadata(bloomberg_scraper):
+def test_bloomberg_multiple_articles_metadata(bloomberg_scraper, cached_extract):
     """Testa extração de metadados de múltiplos artigos."""
     urls = bloomberg_scraper.get_latest_articles(limit=3)
     
@@ -103,8 +99,7 @@ def test_bloomberg_multiple_articles_metadata(bloomberg_scraper):
     articles_with_text = 0
     
     for url in urls:
-        bloomberg_scraper.scraper.get_page(url, wait_time=2)
-        article = extract_article_metadata(url, bloomberg_scraper.scraper.driver)
+        article = cached_extract(url, bloomberg_scraper.scraper)
         
         if article.date_published:
             articles_with_date += 1
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+
+from news_scraper.browser import BrowserConfig, ProfessionalScraper
+from news_scraper.sources import tools
+
+
+# Feed infinito local: cada scroll até o fim agenda um lote de 10 itens que
+# só chega 400ms depois (como um fetch), até 3 lotes
+LAZY_FEED_HTML = """<!DOCTYPE html>
+<html><body>
+<ul id="feed"></ul>
+<script>
+  const feed = document.getElementById("feed");
+  let batches = 0, loading = false;
+  function addItems() {
+    for (let i = 0; i < 10; i++) {
+      const li = document.createElement("li");
+      li.style.height = "200px";
+      li.textContent = "item";
+      feed.appendChild(li);
+    }
+  }
+  addItems();
+  window.addEventListener("scroll", () => {
+    const atBottom = window.innerHeight + window.scrollY >= document.body.scrollHeight - 10;
+    if (!atBottom || loading || batches >= 3) return;
+    loading = true;
+    setTimeout(() => { addItems(); batches += 1; loading = false; }, 400);
+  });
+</script>
+</body></html>
+"""
+
+
+class LazyFeedDriver:
+    """
+    Feed que cresce alguns polls depois de cada scroll.
+
+    Resource Timing informa rede ociosa o tempo todo, como logo após um
+    scroll cujo lote ainda não foi requisitado.
+    """
+
+    def __init__(self, batches: int, delay_polls: int = 3):
+        self.height = 1000
+        self.batches = batches
+        self.delay_polls = delay_polls
+        self.pending: int | None = None
+        self.scrolls = 0
+        self.page_source = "<html></html>"
+
+    def execute_script(self, script, *args):
+        if "scrollTo" in script:
+            self.scrolls += 1
+            if self.batches and self.pending is None:
+                self.pending = self.delay_polls
+            return None
+        if "scrollHeight" in script:
+            if self.pending is not None:
+                self.pending -= 1
+                if self.pending <= 0:
+                    self.pending = None
+                    self.batches -= 1
+                    self.height += 1000
+            return self.height
+        return 10_000.0  # ms desde a última resposta: "ociosa"
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(tools.time, "sleep", lambda seconds: None)
+
+
+def test_network_idle_waits_for_delayed_lazy_load(no_sleep):
+    scraper = ProfessionalScraper(BrowserConfig())
+    scraper.driver = LazyFeedDriver(batches=3)
+
+    scraper.scroll_and_load(scroll_pause=0.05, max_scrolls=10, wait_strategy="network_idle")
+
+    assert scraper.driver.height == 4000
+    assert scraper.driver.scrolls == 4  # 3 lotes + 1 scroll sem conteúdo novo
+
+
+def test_page_growth_times_out_when_feed_ends(no_sleep):
+    driver = LazyFeedDriver(batches=0)
+    assert tools.wait_for_page_growth(driver, driver.height, timeout=0.0) is None
+
+
+def test_scroll_and_load_sleeps_by_default(monkeypatch):
+    from news_scraper import browser
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(browser.time, "sleep", sleeps.append)
+    scraper = ProfessionalScraper(BrowserConfig())
+    scraper.driver = LazyFeedDriver(batches=0)
+
+    scraper.scroll_and_load(scroll_pause=2.0, max_scrolls=3)
+
+    assert sleeps == [2.0]
+
+
+@pytest.mark.integration
+def test_network_idle_loads_real_lazy_feed(tmp_path):
+    page = tmp_path / "feed.html"
+    page.write_text(LAZY_FEED_HTML, encoding="utf-8")
+
+    with ProfessionalScraper(BrowserConfig(headless=True)) as scraper:
+        scraper.driver.get(page.as_uri())
+        scraper.scroll_and_load(scroll_pause=3.0, max_scrolls=6, wait_strategy="network_idle")
+        items = scraper.driver.execute_script("return document.querySelectorAll('#feed li').length")
+
+    assert items == 40
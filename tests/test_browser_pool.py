@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import queue
+import weakref
+
+import pytest
+
+from news_scraper.browser import BrowserConfig, BrowserPool, ProfessionalScraper
+from news_scraper.sources import JobResult, scrape_many, scrape_many_async
+from news_scraper.sources.base_scraper import BaseScraper, get_scraper
+from news_scraper.sources.tools import RateLimiter
+
+
+class FakeDriver:
+    current_url = "about:blank"
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_chrome(monkeypatch):
+    def start(self, use_proxy=None):
+        self.driver = FakeDriver()
+
+    monkeypatch.setattr(ProfessionalScraper, "start", start)
+
+
+def test_pool_reuses_released_browsers():
+    with BrowserPool(BrowserConfig(), min_size=1, max_size=2) as pool:
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+
+
+def test_pool_grows_up_to_max_size(monkeypatch):
+    monkeypatch.setenv("SCRAPER_POOL_MIN_SIZE", "0")
+    monkeypatch.setenv("SCRAPER_POOL_MAX_SIZE", "2")
+    with BrowserPool() as pool:
+        a = pool.acquire()
+        b = pool.acquire()
+        assert a is not b
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.01)
+
+
+def test_pool_restarts_dead_browser():
+    with BrowserPool(min_size=1, max_size=1) as pool:
+        with pool.browser() as browser:
+            browser.driver = None
+        with pool.browser() as browser:
+            assert browser.driver is not None
+
+
+def test_pool_starts_chrome_outside_the_lock(monkeypatch):
+    pool = BrowserPool(min_size=1, max_size=2)
+    held: list[bool] = []
+
+    def start(self, use_proxy=None):
+        held.append(pool._lock.locked())
+        self.driver = FakeDriver()
+
+    monkeypatch.setattr(ProfessionalScraper, "start", start)
+    with pool:
+        pool.acquire()
+        pool.acquire()
+    assert held == [False, False]
+
+
+def test_pool_frees_the_slot_when_chrome_fails_to_start(monkeypatch):
+    failures = [RuntimeError("chrome não iniciou")]
+
+    def start(self, use_proxy=None):
+        if failures:
+            raise failures.pop()
+        self.driver = FakeDriver()
+
+    monkeypatch.setattr(ProfessionalScraper, "start", start)
+    with BrowserPool(min_size=0, max_size=1) as pool:
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        assert pool.acquire(timeout=0.01).driver is not None
+
+
+def test_pool_scraper_borrows_browser_through_pool_context():
+    with BrowserPool(min_size=1, max_size=1) as pool:
+        with FakeSourceScraper(pool)._browser() as browser:
+            assert pool._idle.empty()
+            assert browser.driver is not None
+        assert pool._idle.qsize() == 1
+
+
+class FakeSourceScraper(BaseScraper):
+    def __init__(self, browser):
+        super().__init__(browser, source_id="fake")
+        self.rate_limiter = RateLimiter(requests_per_second=0)
+
+    def _collect_urls(self, category=None, limit=20, start_date=None, end_date=None):
+        assert self.scraper.driver is not None
+        return [f"https://example.com/{category}/{i}" for i in range(limit)]
+
+
+def test_scrape_many_runs_each_job_with_a_pool_browser():
+    jobs = [(FakeSourceScraper, "a"), (FakeSourceScraper, "b"), (FakeSourceScraper, None)]
+    with BrowserPool(min_size=0, max_size=2) as pool:
+        results = scrape_many(pool, jobs, limit=2)
+        assert len(pool._browsers) <= 2
+    assert results[(FakeSourceScraper, "a")].urls == [
+        "https://example.com/a/0",
+        "https://example.com/a/1",
+    ]
+    assert list(results) == jobs
+    assert all(result.error is None for result in results.values())
+
+
+def test_scrape_many_async_matches_sync_results():
+    jobs = [(FakeSourceScraper, "a"), (FakeSourceScraper, "b")]
+    with BrowserPool(min_size=0, max_size=2) as pool:
+        results = asyncio.run(scrape_many_async(pool, jobs, limit=1))
+    assert results == {
+        (FakeSourceScraper, "a"): JobResult(["https://example.com/a/0"]),
+        (FakeSourceScraper, "b"): JobResult(["https://example.com/b/0"]),
+    }
+
+
+class BrokenSourceScraper(FakeSourceScraper):
+    def get_latest_articles(self, *args, **kwargs):
+        raise RuntimeError("listagem fora do ar")
+
+
+def test_scrape_many_keeps_the_error_of_a_failing_job():
+    jobs = [(BrokenSourceScraper, None), (FakeSourceScraper, "a")]
+    with BrowserPool(min_size=0, max_size=2) as pool:
+        results = scrape_many(pool, jobs, limit=1)
+    assert results[(BrokenSourceScraper, None)].urls == []
+    assert isinstance(results[(BrokenSourceScraper, None)].error, RuntimeError)
+    assert results[(FakeSourceScraper, "a")] == JobResult(["https://example.com/a/0"])
+
+
+def test_get_scraper_caches_per_browser_without_keeping_it_alive():
+    browser = ProfessionalScraper(BrowserConfig())
+    scraper = get_scraper(FakeSourceScraper, browser)
+    assert get_scraper(FakeSourceScraper, browser) is scraper
+    assert get_scraper(FakeSourceScraper, ProfessionalScraper(BrowserConfig())) is not scraper
+
+    ref = weakref.ref(browser)
+    del browser, scraper
+    gc.collect()
+    assert ref() is None
@@ -7,3 +7,53 @@ def test_cli_builds_parser():
     p = build_parser()
     args = p.parse_args(["scrape", "--url", "https://example.com", "--out", "out.jsonl"])
     assert args.cmd == "scrape"
+
+
+def test_collect_runs_sources_in_one_parallel_batch(monkeypatch, tmp_path):
+    from news_scraper import cli, sources
+    from news_scraper.sources import JobResult
+
+    calls = []
+
+    def fake_scrape_many(pool, jobs, limit=20):
+        calls.append((pool.max_size, [(cls.__name__, category) for cls, category in jobs], limit))
+        return {
+            jobs[0]: JobResult(["https://www.infomoney.com.br/mercados/a/"]),
+            jobs[1]: JobResult(["https://www.moneytimes.com.br/b/"]),
+        }
+
+    monkeypatch.setattr(sources, "scrape_many", fake_scrape_many)
+    urls_out = tmp_path / "urls.txt"
+    rc = cli.main([
+        "collect", "--source", "infomoney", "--source", "moneytimes", "--source", "infomoney",
+        "--category", "mercados", "--limit", "2", "--skip-scrape", "--urls-out", str(urls_out),
+    ])
+
+    assert rc == 0
+    assert calls == [(2, [("InfoMoneyScraper", "mercados"), ("MoneyTimesScraper", None)], 2)]
+    assert urls_out.read_text(encoding="utf-8").split() == [
+        "https://www.infomoney.com.br/mercados/a/",
+        "https://www.moneytimes.com.br/b/",
+    ]
+
+
+def test_collect_reports_a_failing_source(monkeypatch, capsys):
+    from news_scraper import cli, sources
+    from news_scraper.sources import JobResult
+
+    def fake_scrape_many(pool, jobs, limit=20):
+        return {
+            jobs[0]: JobResult(error=RuntimeError("listagem fora do ar")),
+            jobs[1]: JobResult(["https://www.moneytimes.com.br/b/"]),
+        }
+
+    monkeypatch.setattr(sources, "scrape_many", fake_scrape_many)
+    rc = cli.main([
+        "collect", "--source", "infomoney", "--source", "moneytimes", "--skip-scrape", "--verbose",
+    ])
+
+    captured = capsys.readouterr()
+    assert rc == 0
+    assert "✗ Erro: listagem fora do ar" in captured.out
+    assert "✓ Coletadas 1 URLs" in captured.out
+    assert "RuntimeError: listagem fora do ar" in captured.err
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-from news_scraper.extract import extract_article
+import pytest
+
+
+HTML = """
+<html>
+  <head><title>Minha Notícia</title></head>
+  <body><p>Primeiro parágrafo.</p><p>Segundo parágrafo.</p></body>
+</html>
+"""
+
+
+@pytest.fixture(scope="module")
+def parsed_html():
+    """Árvore de HTML parseada uma vez para o módulo (extract_article não a modifica)."""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(HTML, "lxml")
 
 
 def test_extract_article_fallback_parses_title_and_text():
-    html = """
-    <html>
-      <head><title>Minha Notícia</title></head>
-      <body><p>Primeiro parágrafo.</p><p>Segundo parágrafo.</p></body>
-    </html>
-    """
-    article = extract_article(html, "https://example.com/a")
+    from news_scraper.extract import extract_article
+
+    article = extract_article(HTML, "https://example.com/a")
     assert article.title
     assert "Minha Notícia" in article.title
     assert article.text
     assert "Primeiro" in article.text
+
+
+def test_extract_article_reuses_parsed_tree(parsed_html):
+    from bs4 import BeautifulSoup
+
+    from news_scraper.extract import extract_article
+
+    article = extract_article(HTML, "https://example.com/a", soup=parsed_html)
+    assert article == extract_article(HTML, "https://example.com/a")
+    assert str(parsed_html) == str(BeautifulSoup(HTML, "lxml"))
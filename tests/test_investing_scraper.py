@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from news_scraper.sources.en import InvestingComScraper
+
+
+LISTING_HTML = """
+<html>
+  <body>
+    <article><a data-test="article-title-link" href="/news/stock-market-news/alta-123">A</a></article>
+    <a class="title" href="/news/economy/juros-456?utm=x">B</a>
+    <a class="title" href="/news/economy/sem-id">C</a>
+    <a class="title" href="/news/pro/exclusivo-789">D</a>
+  </body>
+</html>
+"""
+
+
+def test_parse_listing_filters_and_normalizes_urls():
+    scraper = InvestingComScraper(browser_scraper=None)
+    urls = scraper._parse_listing(LISTING_HTML, limit=10)
+    assert urls == ["https://www.investing.com/news/stock-market-news/alta-123"]
+
+
+def test_parse_listing_is_memoized_by_content():
+    scraper = InvestingComScraper(browser_scraper=None)
+    first = scraper._parse_listing(LISTING_HTML, limit=10)
+    first.append("mutated")
+    assert scraper._parse_listing(LISTING_HTML, limit=10) == first[:-1]
+
+
+def test_parse_listing_keeps_links_nested_in_title_blocks():
+    html = """
+    <html><body>
+      <div class="largeTitle"><article><a href="/news/economy/pib-2024">PIB</a></article></div>
+      <script>document.write('<a class="title" href="/news/x/fake-1">x</a>')</script>
+    </body></html>
+    """
+    scraper = InvestingComScraper(browser_scraper=None)
+    assert scraper._parse_listing(html, limit=10) == ["https://www.investing.com/news/economy/pib-2024"]
+
+
+def test_parse_listing_cache_is_safe_across_threads(monkeypatch):
+    monkeypatch.setattr(InvestingComScraper, "LISTING_CACHE_SIZE", 4)
+    scraper = InvestingComScraper(browser_scraper=None)
+    pages = [LISTING_HTML.replace("alta-123", f"alta-{i}23") for i in range(1, 9)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda html: scraper._parse_listing(html, 10), pages * 25))
+
+    expected = [f"https://www.investing.com/news/stock-market-news/alta-{i}23" for i in range(1, 9)]
+    assert results[:8] == [[url] for url in expected]
+    assert len(InvestingComScraper._LISTING_CACHE) <= 4
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from news_scraper.sources import base_scraper
+from news_scraper.sources.en import ReutersScraper, WSJScraper
+
+
+class FakeDriver:
+    """Simula uma listagem que revela mais links (e cresce) a cada scroll."""
+
+    def __init__(self, pages: list[list[str]], grows: bool = True):
+        self.pages = pages
+        self.grows = grows
+        self.scrolls = 0
+
+    def execute_script(self, script, *args):
+        if "querySelectorAll" in script:
+            return self.pages[min(self.scrolls, len(self.pages) - 1)]
+        if "scrollBy" in script:
+            self.scrolls += 1
+            return None
+        if "scrollHeight" in script:
+            return 1000 * (self.scrolls + 1) if self.grows else 1000
+        return None
+
+
+def test_harvest_does_not_scroll_when_first_render_is_enough():
+    driver = FakeDriver([[f"https://www.wsj.com/articles/a-{i}" for i in range(5)]])
+    urls = WSJScraper(scraper=None)._harvest_links(driver, limit=3)
+    assert len(urls) == 3
+    assert driver.scrolls == 0
+
+
+def test_harvest_scrolls_until_limit_and_filters():
+    driver = FakeDriver([
+        ["https://www.reuters.com/markets/a", "https://www.reuters.com/video/x"],
+        ["https://www.reuters.com/markets/a", "https://www.reuters.com/business/b"],
+    ])
+    urls = ReutersScraper(scraper=None)._harvest_links(driver, limit=2)
+    assert urls == ["https://www.reuters.com/markets/a", "https://www.reuters.com/business/b"]
+    assert driver.scrolls == 1
+
+
+def test_harvest_stops_after_max_scrolls():
+    driver = FakeDriver([[]])
+    scraper = WSJScraper(scraper=None)
+    assert scraper._harvest_links(driver, limit=5) == []
+    assert driver.scrolls == scraper.MAX_SCROLLS
+
+
+def test_harvest_stops_when_scroll_loads_nothing_new():
+    driver = FakeDriver([["https://www.wsj.com/articles/a-1"]], grows=False)
+    scraper = WSJScraper(scraper=None)
+    scraper.SCROLL_WAIT_TIMEOUT = 0.0
+    assert scraper._harvest_links(driver, limit=5) == ["https://www.wsj.com/articles/a-1"]
+    assert driver.scrolls == 1
+
+
+@pytest.mark.parametrize("use_re2", [True, False])
+def test_url_filters_behave_the_same_with_and_without_re2(monkeypatch, use_re2):
+    if use_re2 and base_scraper.re2 is None:
+        pytest.skip("google-re2 não instalado")
+    if not use_re2:
+        monkeypatch.setattr(base_scraper, "re2", None)
+    reject = base_scraper.compile_url_filter(r"/autor/|utm_", re.IGNORECASE)
+    assert reject.search("https://x.com/AUTOR/fulano")
+    assert not reject.search("https://x.com/mercados/alta")
+    assert base_scraper._ignores_case(reject)
+    assert not base_scraper._ignores_case(base_scraper.compile_url_filter(r"/articles/"))
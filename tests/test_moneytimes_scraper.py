@@ -9,7 +9,6 @@ import pytest
 from datetime import datetime
 from news_scraper.sources.pt import MoneyTimesScraper
 from news_scraper.browser import BrowserConfig, ProfessionalScraper
-from news_scraper.extract import extract_article_metadata
 
 
 @pytest.fixture(scope="module")
@@ -41,7 +40,7 @@ def test_moneytimes_get_latest_articles(moneytimes_scraper):
         assert len(url) > 50, "URLs de artigos devem ser longas"
 
 
-def test_moneytimes_extract_metadata(moneytimes_scraper):
+def test_moneytimes_extract_metadata(moneytimes_scraper, cached_extract):
     """Testa extração de metadados completos de um artigo."""
     # Coletar uma URL recente
     urls = moneytimes_scraper.get_latest_articles(limit=1)
@@ -49,11 +48,8 @@ def test_moneytimes_extract_metadata(moneytimes_scraper):
     
     url = urls[0]
     
-    # Acessar a página do artigo
-    moneytimes_scraper.scraper.get_page(url, wait_time=3)
-    
-    # Extrair metadados
-    article = extract_article_metadata(url, moneytimes_scraper.scraper.driver)
+    # Acessar a página do artigo e extrair metadados (uma vez por URL na sessão)
+    article = cached_extract(url, moneytimes_scraper.scraper)
     
     # Validar campos essenciais
     assert article.url == url
@@ -85,7 +81,7 @@ def test_moneytimes_extract_metadata(moneytimes_scraper):
     print(f"  Source: {article.source}")
 
 
-def test_moneytimes_multiple_articles_metadata(moneytimes_scraper):
+def test_moneytimes_multiple_articles_metadata(moneytimes_scraper, cached_extract):
     """Testa extração de metadados de múltiplos artigos."""
     urls = moneytimes_scraper.get_latest_articles(limit=3)
     
@@ -94,8 +90,7 @@ def test_moneytimes_multiple_articles_metadata(moneytimes_scraper):
     articles_with_text = 0
     
     for url in urls:
-        moneytimes_scraper.scraper.get_page(url, wait_time=2)
-        article = extract_article_metadata(url, moneytimes_scraper.scraper.driver)
+        article = cached_extract(url, moneytimes_scraper.scraper)
         
         if article.date_published:
             articles_with_date += 1
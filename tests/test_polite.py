@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from news_scraper import scrape
+from news_scraper.polite import PoliteSession, PoliteSettings
+
+
+class FakeResponse:
+    status_code = 200
+    text = "<html><head><title>Ok</title></head><body><p>Texto.</p></body></html>"
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, headers))
+        return FakeResponse()
+
+
+def test_polite_sessions_can_share_one_http_session():
+    shared = FakeSession()
+    for user_agent in ("a", "b"):
+        settings = PoliteSettings(delay_seconds=0, respect_robots=False, user_agent=user_agent)
+        PoliteSession(settings, session=shared).get("https://example.com/x")
+    assert [headers["User-Agent"] for _, headers in shared.calls] == ["a", "b"]
+
+
+def test_scrape_urls_uses_the_test_session(http_session, monkeypatch, tmp_path):
+    assert scrape.PoliteSession.keywords["session"] is http_session
+
+    fake = FakeSession()
+    monkeypatch.setattr(http_session, "get", fake.get)
+    scrape.scrape_urls(
+        ["https://example.com/a"], tmp_path / "a.jsonl", respect_robots=False, delay_seconds=0
+    )
+    assert [url for url, _ in fake.calls] == ["https://example.com/a"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import re
+import sys
+
+from news_scraper.sources.pt import InfoMoneyScraper, MoneyTimesScraper
+
+
+class FakeDriver:
+    def __init__(self, hrefs: list[str | None]):
+        self.hrefs = hrefs
+        self.scripts: list[str] = []
+        self.selectors: list[str] = []
+
+    def execute_script(self, script, *args):
+        """Reproduz em Python o filtro de BaseScraper._FILTERED_HREFS_JS."""
+        self.scripts.append(script)
+        selector, domain, min_length, reject, flags = args
+        self.selectors.append(selector)
+        reject_re = re.compile(reject, re.IGNORECASE if "i" in flags else 0) if reject else None
+        return [
+            h for h in self.hrefs
+            if h and domain in h and len(h) > min_length and not (reject_re and reject_re.search(h))
+        ]
+
+
+class FakeBrowser:
+    """Browser mínimo: sem Chrome, devolve hrefs fixos via execute_script."""
+
+    def __init__(self, hrefs: list[str | None]):
+        self.driver = FakeDriver(hrefs)
+
+    def get_page(self, url, wait_time=0):
+        return ""
+
+    def scroll_and_load(self, **kwargs):
+        return ""
+
+
+INFOMONEY_ARTICLE = "https://www.infomoney.com.br/mercados/ibovespa-fecha-em-alta-com-commodities/"
+
+
+def test_infomoney_reads_all_hrefs_in_one_script_call():
+    browser = FakeBrowser([
+        None,
+        INFOMONEY_ARTICLE,
+        "https://www.infomoney.com.br/autor/fulano-de-tal-colunista-de-mercados/",
+        "https://www.infomoney.com.br/mercados/ibovespa?utm_source=twitter&utm_medium=social",
+        "https://example.com/mercados/outro-site-com-url-bem-longa-para-teste/",
+    ])
+    urls = InfoMoneyScraper(browser)._collect_urls(limit=10)
+    assert urls == [INFOMONEY_ARTICLE]
+    assert len(browser.driver.scripts) == 1
+    assert browser.driver.selectors == ["a"]  # todos os links da página, filtrados no navegador
+
+
+def test_moneytimes_reject_pattern_ignores_case():
+    article = "https://www.moneytimes.com.br/petrobras-anuncia-dividendos-extraordinarios-igdl/"
+    browser = FakeBrowser([
+        article,
+        "https://www.moneytimes.com.br/AUTOR/fulano-de-tal-colunista-money-times-mabe/",
+    ])
+    assert MoneyTimesScraper(browser)._collect_urls(limit=10) == [article]
+
+
+def test_collect_urls_keeps_page_order_and_stops_at_limit():
+    hrefs = [
+        f"https://www.infomoney.com.br/mercados/{slug}-fecha-em-alta-com-commodities/"
+        for slug in ("zeta", "alfa", "zeta", "beta", "gama")
+    ]
+    urls = InfoMoneyScraper(FakeBrowser(hrefs))._collect_urls(limit=3)
+    assert urls == [hrefs[0], hrefs[1], hrefs[3]]
+
+
+def test_collected_urls_are_interned_unless_disabled(monkeypatch):
+    parts = ["https://www.infomoney.com.br/mercados/", "ibovespa-fecha-em-alta-com-commodities/"]
+    canonical = sys.intern("".join(parts))
+    href = "".join(parts)  # igual, mas outro objeto
+    assert href is not canonical
+    scraper = InfoMoneyScraper(FakeBrowser([href]))
+    assert scraper._collect_urls(limit=1)[0] is canonical
+
+    monkeypatch.setattr(InfoMoneyScraper, "INTERN_URLS", False)
+    assert scraper._collect_urls(limit=1)[0] is href
+
+
+def test_reject_patterns_are_portable_to_javascript_regexp():
+    from news_scraper.sources.pt import EInvestidorScraper, ValorScraper
+
+    for cls in (InfoMoneyScraper, MoneyTimesScraper, EInvestidorScraper, ValorScraper):
+        # Flags inline e grupos nomeados do Python não existem no RegExp do JS
+        assert "(?" not in cls._REJECT_RE.pattern
+
+
+def test_bloomberg_reads_hrefs_in_one_script_call():
+    from news_scraper.sources.en import BloombergScraper
+
+    article = "https://www.bloomberg.com.br/news/articles/2026-01-28/ibovespa-fecha-em-alta"
+    browser = FakeBrowser([
+        article,
+        "https://www.bloomberg.com.br/news/autor/fulano-de-tal-colunista",
+        "https://www.bloomberg.com.br/mercados/ibovespa-fecha-em-alta-hoje",
+    ])
+    assert BloombergScraper(browser)._collect_urls(limit=10) == [article]
+    assert len(browser.driver.scripts) == 1
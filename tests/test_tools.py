@@ -0,0 +1,457 @@
+"""
+Testes offline das ferramentas de scraping (sources/tools.py).
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import os
+import time
+import weakref
+from datetime import datetime
+
+import pytest
+
+from news_scraper.sources import tools
+from news_scraper.sources.tools import (
+    AntiBotEvasion,
+    ContentValidator,
+    DateNormalizer,
+    DomainRateLimiter,
+    PaywallDetector,
+    RateLimiter,
+    RetryConfig,
+    RetryStrategy,
+    SimpleCache,
+    TextCleaner,
+    UserAgentRotator,
+)
+
+
+def test_browser_headers_do_not_share_state():
+    rotator = UserAgentRotator()
+    first = rotator.get_browser_headers()
+    first["Accept"] = "mutated"
+    second = rotator.get_browser_headers()
+    assert second["Accept"].startswith("text/html")
+    assert second["User-Agent"] in rotator.USER_AGENTS
+    assert next(iter(second)) == "User-Agent"
+
+
+def test_rate_limiter_uses_monotonic_clock(monkeypatch):
+    clock = iter([100.0, 100.25, 100.25])
+    sleeps: list[float] = []
+    monkeypatch.setattr(tools.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(tools.time, "time", lambda: 0.0)  # relógio de parede não importa
+    monkeypatch.setattr(tools.time, "sleep", sleeps.append)
+
+    limiter = RateLimiter(requests_per_second=2)
+    assert limiter.wait_if_needed("a") == 0.0
+    assert limiter.wait_if_needed("a") == 0.25
+    assert sleeps == [0.25]
+
+
+def test_retry_delays_are_precomputed_and_capped():
+    strategy = RetryStrategy(RetryConfig(max_attempts=4, initial_delay=1.0, max_delay=3.0, jitter=False))
+    assert [strategy.get_delay(i) for i in range(4)] == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_retry_execute_sleeps_between_attempts(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(tools.time, "sleep", sleeps.append)
+    calls = iter([ValueError("x"), ValueError("y"), "ok"])
+
+    def flaky():
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    strategy = RetryStrategy(RetryConfig(max_attempts=3, initial_delay=0.5, jitter=False))
+    assert strategy.execute(flaky) == "ok"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_domain_rate_limiter_waits_only_for_same_domain(monkeypatch):
+    clock = iter([10.0, 10.0, 10.5, 11.0])
+    sleeps: list[float] = []
+    monkeypatch.setattr(tools.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(tools.time, "sleep", sleeps.append)
+
+    limiter = DomainRateLimiter(default_delay=2.0)
+    limiter.set_domain_delay("b.com", 0.1)
+    limiter.wait("a.com")
+    limiter.wait("b.com")
+    limiter.wait("a.com")
+    assert sleeps == [1.5]
+
+
+class FakeBlake3:
+    """Substituto do blake3 (opcional) com a mesma interface."""
+
+    def __init__(self, data: bytes):
+        self._digest = hashlib.sha256(data).hexdigest()
+
+    def hexdigest(self, length: int = 32) -> str:
+        return self._digest[: length * 2]
+
+
+def test_cache_migrates_legacy_md5_entries_lazily(tmp_path, monkeypatch):
+    legacy = SimpleCache(tmp_path, hash_algo="md5")
+    legacy.set("https://example.com/a", {"ok": True})
+    legacy.flush()
+    monkeypatch.setattr(tools, "blake3", FakeBlake3)
+
+    cache = SimpleCache(tmp_path, hash_algo="blake3")
+    assert cache.get("https://example.com/a") == {"ok": True}
+    assert [p.relative_to(tmp_path) for p in tmp_path.rglob("*.json")] == [
+        cache._get_cache_path("https://example.com/a").relative_to(tmp_path)
+    ]
+    assert cache.get("https://example.com/missing") is None
+
+
+def test_cache_falls_back_to_blake2b_without_optional_hashers(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, "blake3", None)
+    monkeypatch.setattr(tools, "xxhash", None)
+    assert SimpleCache(tmp_path, hash_algo="blake3").hash_algo == "blake2b"
+    assert SimpleCache(tmp_path, hash_algo="xxhash").hash_algo == "blake2b"
+
+
+def test_cache_defaults_to_blake2b_and_reads_md5_entries(tmp_path):
+    legacy = SimpleCache(tmp_path, hash_algo="md5")
+    legacy.set("k", [1, 2])
+    legacy.flush()
+    cache = SimpleCache(tmp_path)
+    assert cache.hash_algo == "blake2b"
+    assert cache.get("k") == [1, 2]
+    assert cache._get_cache_path("k").name == hashlib.blake2b(b"k", digest_size=16).hexdigest() + ".json"
+
+
+def test_user_agents_are_immutable():
+    assert isinstance(UserAgentRotator.USER_AGENTS, tuple)
+    rotator = UserAgentRotator()
+    assert [rotator.get_next() for _ in rotator.USER_AGENTS] == list(rotator.USER_AGENTS)
+
+
+class IdleDriver:
+    """Devolve, a cada chamada, os ms desde a última resposta de rede."""
+
+    def __init__(self, idle_values: list[float]):
+        self.idle_values = iter(idle_values)
+
+    def execute_script(self, script, *args):
+        return next(self.idle_values)
+
+
+def test_wait_for_network_idle_returns_once_quiet(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(tools.time, "sleep", sleeps.append)
+    driver = IdleDriver([100.0, 300.0, 600.0])
+    assert tools.wait_for_network_idle(driver, idle_ms=500, timeout=5.0) is True
+    assert sleeps == [0.4, 0.2]
+
+
+def test_wait_for_network_idle_times_out(monkeypatch):
+    monkeypatch.setattr(tools.time, "sleep", lambda seconds: None)
+    driver = IdleDriver([0.0, 0.0, 0.0])
+    assert tools.wait_for_network_idle(driver, idle_ms=500, timeout=0.0) is False
+
+
+def test_retry_jitter_stays_within_bounds_and_varies():
+    strategy = RetryStrategy(RetryConfig(max_attempts=2, initial_delay=1.0, max_delay=60.0))
+    delays = [strategy.get_delay(0) for _ in range(128)]
+    assert all(0.5 <= d <= 1.5 for d in delays)
+    assert len(set(delays[:64])) > 1
+    assert delays[:64] == delays[64:]
+
+
+def test_retry_config_uses_slots():
+    config = RetryConfig()
+    assert not hasattr(config, "__dict__")
+    with pytest.raises(AttributeError):
+        config.max_attemps = 5  # typo não cria atributo novo silenciosamente
+
+
+def test_cache_key_hash_is_memoized(tmp_path):
+    cache = SimpleCache(tmp_path)
+    before = tools._hash_key.cache_info().hits
+    cache.get("https://example.com/memo")
+    cache.set("https://example.com/memo", "v")
+    assert tools._hash_key.cache_info().hits > before
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_cache_roundtrip_is_compact_json(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and tools.orjson is None:
+        pytest.skip("orjson não instalado")
+    if not use_orjson:
+        monkeypatch.setattr(tools, "orjson", None)
+    cache = SimpleCache(tmp_path)
+    cache.set("k", {"título": "Ibovespa", "n": [1, 2]})
+    cache.flush()
+    raw = cache._get_cache_path("k").read_bytes()
+    assert b"\n" not in raw and "título".encode() in raw
+    assert cache.get("k") == {"título": "Ibovespa", "n": [1, 2]}
+
+
+def test_cache_reads_legacy_indented_entries(tmp_path):
+    cache = SimpleCache(tmp_path)
+    legacy = {"cached_at": datetime.now().isoformat(), "value": "antigo"}
+    flat_path = tmp_path / cache._get_cache_path("k").name  # layout plano antigo
+    flat_path.write_text(json.dumps(legacy, ensure_ascii=False, indent=2))
+    assert cache.get("k") == "antigo"
+
+
+def test_cache_stores_epoch_timestamps_and_expires(tmp_path, monkeypatch):
+    cache = SimpleCache(tmp_path, ttl_hours=1)
+    monkeypatch.setattr(tools.time, "time", lambda: 1_000.0)
+    cache.set("k", "v")
+    cache.flush()
+    assert json.loads(cache._get_cache_path("k").read_bytes())["cached_at"] == 1_000.0
+
+    monkeypatch.setattr(tools.time, "time", lambda: 1_000.0 + 3_599)
+    assert cache.get("k") == "v"
+    monkeypatch.setattr(tools.time, "time", lambda: 1_000.0 + 3_601)
+    assert cache.get("k") is None
+    assert not cache._get_cache_path("k").exists()
+
+
+def test_clear_expired_uses_file_mtime_without_parsing(tmp_path):
+    cache = SimpleCache(tmp_path, ttl_hours=1)
+    cache.set("old", "v")
+    cache.set("new", "v")
+    cache.flush()
+    old_path = cache._get_cache_path("old")
+    old_path.write_bytes(b"not json")  # conteúdo não é lido
+    stale = time.time() - 7200
+    os.utime(old_path, (stale, stale))
+
+    cache.clear_expired()
+    assert not old_path.exists()
+    assert cache.get("new") == "v"
+
+
+def test_cache_coalesces_writes_until_flush(tmp_path, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(tools.time, "monotonic", lambda: clock[0])
+    cache = SimpleCache(tmp_path)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get("a") == 1  # lido do buffer pendente
+
+    clock[0] += SimpleCache.FLUSH_INTERVAL
+    cache.set("c", 3)
+    assert len(list(tmp_path.rglob("*.json"))) == 3
+    assert SimpleCache(tmp_path).get("b") == 2
+
+
+def test_cache_flushes_on_close_and_exit_hook(tmp_path):
+    with SimpleCache(tmp_path / "closed") as cache:
+        cache.set("a", 1)
+    assert len(list((tmp_path / "closed").rglob("*.json"))) == 1
+    assert cache not in tools._OPEN_CACHES
+
+    open_cache = SimpleCache(tmp_path / "open")
+    open_cache.set("b", 2)
+    tools._flush_open_caches()
+    assert len(list((tmp_path / "open").rglob("*.json"))) == 1
+
+
+def test_discarded_cache_is_not_pinned_and_keeps_its_writes(tmp_path):
+    cache = SimpleCache(tmp_path)
+    cache.set("a", 1)
+    ref = weakref.ref(cache)
+    del cache
+    gc.collect()
+    assert ref() is None
+    assert SimpleCache(tmp_path).get("a") == 1
+
+
+PAYWALL_HTML = """
+<html><body>
+  <p>Conteúdo EXCLUSIVO para assinantes. Subscriber? Sign in.</p>
+  <div class="paywall">Premium</div>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_paywall_detector_finds_indicators_in_list_order(monkeypatch, use_automaton):
+    if use_automaton and PaywallDetector._AUTOMATON is None:
+        pytest.skip("pyahocorasick não instalado")
+    if not use_automaton:
+        monkeypatch.setattr(PaywallDetector, "_AUTOMATON", None)
+    result = PaywallDetector().detect(PAYWALL_HTML)
+    text_hits = [i for i in result["indicators"] if i.startswith("text:")]
+    assert text_hits == [
+        "text:assinante", "text:conteúdo exclusivo", "text:premium",
+        "text:subscribe", "text:subscriber", "text:sign in", "text:premium",
+        "text:paywall",
+    ]
+    assert "selector:.paywall" in result["indicators"]
+    assert result["has_paywall"] and result["confidence"] == 1.0
+
+
+def test_paywall_detector_reports_each_matching_selector_in_order():
+    html = """
+    <div id="paywall"></div>
+    <section data-paywall="1"><p class="article-lock premium-content">x</p></section>
+    """
+    result = PaywallDetector().detect(html)
+    assert [i for i in result["indicators"] if i.startswith("selector:")] == [
+        "selector:#paywall", "selector:.premium-content", "selector:[data-paywall]",
+        "selector:.article-lock",
+    ]
+
+
+def test_paywall_detector_skips_parse_without_selector_tokens(monkeypatch):
+    import bs4
+
+    parses = []
+    monkeypatch.setattr(bs4, "BeautifulSoup", lambda *args, **kwargs: parses.append(args))
+    result = PaywallDetector().detect("<html><body><p>Notícia aberta.</p></body></html>")
+    assert result == {"has_paywall": False, "confidence": 0.0, "indicators": []}
+    assert parses == []
+
+
+def test_text_cleaner_clean_normalizes_whitespace_in_one_pass():
+    raw = "  Título\tda  notícia  \n\n\n\nok\n\nPrimeiro \t parágrafo\t\tcom   espaços.\n"
+    assert TextCleaner.clean(raw) == "Título da notícia\n\n\nPrimeiro parágrafo com espaços."
+    assert TextCleaner.clean("") == ""
+
+
+def test_remove_boilerplate_cuts_at_earliest_pattern():
+    text = "Ibovespa sobe com alta das commodities.\nSiga-nos no X\nCopyright 2024 Fulano"
+    assert TextCleaner.remove_boilerplate(text) == "Ibovespa sobe com alta das commodities."
+    assert TextCleaner.remove_boilerplate("Compartilhe no blog do autor") == "Compartilhe no blog do autor"
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("2026-01-28T10:30:00Z", "2026-01-28T10:30:00Z"),  # ISO é devolvido como veio
+    ("2026-1-5T10:30:00", "2026-01-05"),
+    ("2026-1-5 10:30:00", "2026-01-05"),
+    ("28/01/2026", "2026-01-28"),
+    ("5/1/2026 14:05", "2026-01-05"),
+    ("2026/01/28", "2026-01-28"),
+    ("31/02/2026", None),
+    ("28 de janeiro de 2026", "2026-01-28"),
+    ("Publicado em 3 de MARÇO de 2026", "2026-03-03"),
+    ("1 de out de 2025", "2025-10-01"),
+    ("1 de outrora de 2025", None),
+    ("ontem", None),
+    ("   ", None),
+    ("Seg-feira, 3 de março de 2026", "2026-03-03"),
+])
+def test_date_normalizer_formats(raw, expected):
+    assert DateNormalizer.normalize(raw) == expected
+
+
+def test_content_validator_counts_link_lines_not_link_occurrences():
+    prose = "O Ibovespa fechou em alta nesta sexta. Petróleo subiu. Juros caíram. " * 3
+    text = f"{prose}\nFonte: https://www.exemplo.com.br https://www.b3.com.br\n{prose}"
+    assert ContentValidator.is_article_content(text)
+    links = f"https://a.com/1\nwww.b.com\n{prose}"
+    assert not ContentValidator.is_article_content(links)
+
+
+def test_content_validator_needs_two_long_paragraphs():
+    paragraph = "palavra " * 60
+    assert ContentValidator.validate_text(f"{paragraph}\n\n\n{paragraph}")
+    assert not ContentValidator.validate_text(f"{paragraph}\n\ncurto\n\n\n\n")
+
+
+def test_cache_entries_are_sharded_and_swept_recursively(tmp_path):
+    cache = SimpleCache(tmp_path, ttl_hours=1)
+    cache.set("k", "v")
+    cache.flush()
+    path = cache._get_cache_path("k")
+    assert path.parent.parent == tmp_path and path.parent.name == path.name[:2]
+
+    flat = tmp_path / "0123456789abcdef0123456789abcdef.json"
+    flat.write_bytes(b"{}")
+    stale = time.time() - 7200
+    for p in (path, flat):
+        os.utime(p, (stale, stale))
+    cache.clear_expired()
+    assert list(tmp_path.rglob("*.json")) == []
+
+
+def test_cache_honors_per_entry_ttl_and_adjusts_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools.time, "time", lambda: 10_000.0)
+    cache = SimpleCache(tmp_path, ttl_hours=1)
+    cache.set("rss", "feed", ttl=60)
+    cache.set("artigo", "html")
+    cache.flush()
+    assert cache._get_cache_path("rss").stat().st_mtime == 10_000.0 + 60 - 3600
+
+    monkeypatch.setattr(tools.time, "time", lambda: 10_000.0 + 61)
+    assert cache.get("rss") is None
+    assert cache.get("artigo") == "html"
+
+
+def test_cache_negative_entries_are_short_lived(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools.time, "time", lambda: 10_000.0)
+    cache = SimpleCache(tmp_path)
+    cache.set_negative("https://example.com/500")
+    assert cache.get("https://example.com/500") is None
+    assert cache.is_negative("https://example.com/500")
+    assert not cache.is_negative("https://example.com/outra")
+
+    monkeypatch.setattr(tools.time, "time", lambda: 10_000.0 + SimpleCache.NEGATIVE_TTL + 1)
+    assert not cache.is_negative("https://example.com/500")
+
+
+def test_cache_memory_front_serves_hot_keys_without_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(SimpleCache, "MEMORY_ENTRIES", 2)
+    cache = SimpleCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"k": key})
+    cache.flush()
+    for path in tmp_path.rglob("*.json"):
+        path.unlink()
+
+    assert cache.get("c") == {"k": "c"}
+    assert cache.get("b") == {"k": "b"}
+    assert cache.get("a") is None  # despejado do LRU e ausente do disco
+
+    cache.get("c")["k"] = "mutated"
+    assert cache.get("c") == {"k": "c"}
+
+
+def test_date_normalizer_screens_shape_before_regex(monkeypatch):
+    class Boom:
+        def __getattr__(self, name):
+            raise AssertionError("regex não deveria rodar")
+
+    monkeypatch.setattr(DateNormalizer, "_NUMERIC_DATE_RE", Boom())
+    monkeypatch.setattr(DateNormalizer, "_PT_DATE_RE", Boom())
+    assert DateNormalizer.normalize("2026-01-28") == "2026-01-28"
+    assert DateNormalizer.normalize("há 3 horas") is None
+
+
+def test_cache_flush_replaces_entries_atomically(tmp_path, monkeypatch):
+    cache = SimpleCache(tmp_path)
+    cache.set("k", "antigo")
+    cache.flush()
+    path = cache._get_cache_path("k")
+
+    def failing_replace(src, dst):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(tools.os, "replace", failing_replace)
+    cache.set("k", "novo")
+    cache.flush()
+    assert json.loads(path.read_bytes())["value"] == "antigo"
+    assert [p.name for p in path.parent.iterdir()] == [path.name]  # sem .tmp órfão
+
+
+def test_realistic_headers_reuse_one_rotator(monkeypatch):
+    monkeypatch.setattr(tools.UserAgentRotator, "__init__", lambda self: pytest.fail("rotator recriado"))
+    first = AntiBotEvasion.get_realistic_headers(referer="https://www.google.com/")
+    second = AntiBotEvasion.get_realistic_headers()
+    assert first["Referer"] == "https://www.google.com/"
+    assert "Referer" not in second
+    assert second["User-Agent"] in UserAgentRotator.USER_AGENTS
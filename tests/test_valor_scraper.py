@@ -9,7 +9,6 @@ import pytest
 from datetime import datetime
 from news_scraper.sources.pt import ValorScraper
 from news_scraper.browser import BrowserConfig, ProfessionalScraper
-from news_scraper.extract import extract_article_metadata
 
 
 @pytest.fixture(scope="module")
@@ -50,7 +49,7 @@ def test_valor_financas_category(valor_scraper):
         assert "/financas/" in url
 
 
-def test_valor_extract_metadata(valor_scraper):
+def test_valor_extract_metadata(valor_scraper, cached_extract):
     """Testa extração de metadados completos de um artigo."""
     # Coletar uma URL recente
     urls = valor_scraper.get_latest_articles(limit=1)
@@ -58,11 +57,8 @@ def test_valor_extract_metadata(valor_scraper):
     
     url = urls[0]
     
-    # Acessar a página do artigo
-    valor_scraper.scraper.get_page(url, wait_time=3)
-    
-    # Extrair metadados
-    article = extract_article_metadata(url, valor_scraper.scraper.driver)
+    # Acessar a página do artigo e extrair metadados (uma vez por URL na sessão)
+    article = cached_extract(url, valor_scraper.scraper)
     
     # Validar campos essenciais
     assert article.url == url
@@ -94,7 +90,7 @@ def test_valor_extract_metadata(valor_scraper):
     print(f"  Source: {article.source}")
 
 
-def test_valor_multiple_articles_metadata(valor_scraper):
+def test_valor_multiple_articles_metadata(valor_scraper, cached_extract):
     """Testa extração de metadados de múltiplos artigos."""
     urls = valor_scraper.get_latest_articles(limit=3)
     
@@ -103,8 +99,7 @@ def test_valor_multiple_articles_metadata(valor_scraper):
     articles_with_text = 0
     
     for url in urls:
-        valor_scraper.scraper.get_page(url, wait_time=2)
-        article = extract_article_metadata(url, valor_scraper.scraper.driver)
+        article = cached_extract(url, valor_scraper.scraper)
         
         if article.date_published:
             articles_with_date += 1
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import pytest
+
+from news_scraper.sources.en import yahoofinance_scraper
+from news_scraper.sources.en import YahooFinanceUSScraper
+
+
+LISTING_HTML = """
+<html><body>
+  <h3><a href="/news/stocks-rally-today-123.html">A</a></h3>
+  <div data-test-locator="stream-item"><a href="https://finance.yahoo.com/news/fed-holds-rates-456.html">B</a></div>
+  <h3><a href="/video/market-wrap">C</a></h3>
+  <a data-ylk="title" href="https://finance.yahoo.com/news/fed-holds-rates-456.html?src=x">D</a>
+</body></html>
+"""
+
+
+class FakeBrowser:
+    def get_page(self, url, wait_time=None):
+        return LISTING_HTML
+
+    def scroll_and_load(self, **kwargs):
+        return LISTING_HTML
+
+
+@pytest.fixture(params=["lexbor", "bs4"])
+def parser_backend(request, monkeypatch):
+    if request.param == "bs4":
+        monkeypatch.setattr(yahoofinance_scraper, "LexborHTMLParser", None)
+    elif yahoofinance_scraper.LexborHTMLParser is None:
+        pytest.skip("selectolax não instalado")
+    return request.param
+
+
+def test_collect_urls_filters_listing(parser_backend):
+    urls = YahooFinanceUSScraper(FakeBrowser())._collect_urls(limit=10)
+    assert sorted(urls) == [
+        "https://finance.yahoo.com/news/fed-holds-rates-456.html",
+        "https://finance.yahoo.com/news/stocks-rally-today-123.html",
+    ]
+
+
+def test_collect_urls_respects_limit(parser_backend):
+    assert len(YahooFinanceUSScraper(FakeBrowser())._collect_urls(limit=1)) == 1
+
+
+def test_collect_urls_normalizes_relative_and_protocol_relative_links(monkeypatch):
+    html = """
+    <html><body>
+      <h3><a href="/news/rates-rise-789.html">A</a></h3>
+      <h3><a href="//finance.yahoo.com/news/oil-slips-321.html">B</a></h3>
+    </body></html>
+    """
+    browser = FakeBrowser()
+    monkeypatch.setattr(browser, "scroll_and_load", lambda **kwargs: html)
+    assert YahooFinanceUSScraper(browser)._collect_urls(limit=10) == [
+        "https://finance.yahoo.com/news/rates-rise-789.html",
+        "https://finance.yahoo.com/news/oil-slips-321.html",
+    ]
+
+
+def test_collect_urls_ignores_hyphenated_non_article_pages(monkeypatch):
+    html = """
+    <html><body>
+      <h3><a href="/markets/stocks/most-active/">Most active</a></h3>
+      <h3><a href="/topic/stock-market-news/">Topic</a></h3>
+      <h3><a href="/personal-finance/banking/best-savings-rates-today-2026.html">Article</a></h3>
+    </body></html>
+    """
+    browser = FakeBrowser()
+    monkeypatch.setattr(browser, "scroll_and_load", lambda **kwargs: html)
+    assert YahooFinanceUSScraper(browser)._collect_urls(limit=10) == [
+        "https://finance.yahoo.com/personal-finance/banking/best-savings-rates-today-2026.html",
+    ]
+
+
+ARTICLE_HTML = """
+<html><body>
+  <div data-test-locator="headline"><h1>Fed holds rates</h1></div>
+  <div class="caas-attr-meta"><time datetime="2026-01-28T14:00:00Z">Jan 28</time></div>
+  <div class="caas-body"><p>First paragraph.</p><p></p><p>Second paragraph.</p></div>
+</body></html>
+"""
+
+
+def test_extract_fields_parses_once_for_all_fields(monkeypatch):
+    browser = FakeBrowser()
+    monkeypatch.setattr(browser, "get_page", lambda url, wait_time=None: ARTICLE_HTML)
+    parses = []
+    original = yahoofinance_scraper.BeautifulSoup
+    monkeypatch.setattr(
+        yahoofinance_scraper,
+        "BeautifulSoup",
+        lambda *args, **kwargs: parses.append(1) or original(*args, **kwargs),
+    )
+
+    url = "https://finance.yahoo.com/news/fed-holds-rates-456.html"
+    article = YahooFinanceUSScraper(browser)._extract_fields(url)
+    assert article == {
+        "url": url,
+        "title": "Fed holds rates",
+        "text": "First paragraph.\n\nSecond paragraph.",
+        "date": "2026-01-28T14:00:00Z",
+        "source": "Yahoo Finance",
+    }
+    assert len(parses) == 1
+
+
+class FilteringDriver:
+    """Reproduz em Python o filtro de YahooFinanceScraper._NEWS_HREFS_JS."""
+
+    def __init__(self, hrefs):
+        self.hrefs = hrefs
+        self.calls = 0
+
+    def execute_script(self, script, patterns, skips):
+        self.calls += 1
+        return [
+            h for h in self.hrefs
+            if any(p in h for p in patterns) and not any(s in h for s in skips)
+        ]
+
+
+def test_br_latest_news_urls_are_filtered_in_the_browser():
+    from news_scraper.yahoo_finance import YahooFinanceScraper
+
+    browser = FakeBrowser()
+    browser.driver = FilteringDriver([
+        "https://br.financas.yahoo.com/noticias/ibovespa-sobe-123.html",
+        "https://br.finance.yahoo.com/noticias/dolar-cai-456.html",
+        "https://br.finance.yahoo.com/noticias/dolar-cai-456.html?src=rss",
+        "https://br.finance.yahoo.com/video/resumo-do-dia",
+        "https://br.finance.yahoo.com/noticias/juros-789.html",
+    ])
+    urls = YahooFinanceScraper(browser).get_latest_news_urls(limit=10)
+    assert urls == [
+        "https://br.finance.yahoo.com/noticias/dolar-cai-456.html",
+        "https://br.finance.yahoo.com/noticias/juros-789.html",
+    ]
+    assert browser.driver.calls == 1